@@ -11,13 +11,296 @@ This agent takes the wizard's prescription and constructs:
 
 import os
 import re
-import shutil
+import copy
+import asyncio
+import json
+import threading
 import yaml
-import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# orjson is optional; only used when json_output is enabled
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Parsed YAML keyed by (resolved path, mtime_ns); enabled with RLC_YAML_CACHE=1
+_YAML_CACHE: Dict[tuple, Dict] = {}
+
+# Scalars that YAML 1.1 would resolve to bool/null and therefore need quoting
+_YAML_RESERVED_WORDS = frozenset({
+    "y", "n", "yes", "no", "true", "false", "on", "off", "null", "~"
+})
+_YAML_PLAIN_SAFE = re.compile(r"[A-Za-z_/][\w./@+=-]*(?: [\w./@+=-]+)*")
+# Characters the YAML reader folds into line breaks or rejects as non-printable;
+# json.dumps(ensure_ascii=False) leaves them raw, so they are escaped separately
+_YAML_UNSAFE_CHARS = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+
+# Order in which tier setup picks the language to add observability deps for
+_LANGUAGE_PRIORITY = ("python", "rust", "javascript", "typescript")
+
+# Language presence bits for integration dispatch
+_PYTHON_BIT, _RUST_BIT, _JS_BIT, _TS_BIT, _GO_BIT, _JAVA_BIT = (1 << i for i in range(6))
+_LANGUAGE_BITS = {
+    "python": _PYTHON_BIT,
+    "rust": _RUST_BIT,
+    "javascript": _JS_BIT,
+    "typescript": _TS_BIT,
+    "go": _GO_BIT,
+    "java": _JAVA_BIT,
+}
+
+# Artifacts under these repo-relative dirs are written as JSON when json_output is set
+_JSON_OUTPUT_DIRS = ("observability" + os.sep, os.path.join(".rlc", "agents") + os.sep)
+
+# Distribution name at the start of each requirements.txt line; pip option lines
+# (-r, -e, --index-url) start with "-" and are skipped
+_REQUIREMENT_NAME = re.compile(r"^[ \t]*([A-Za-z0-9_.][A-Za-z0-9_.\-]*)", re.M)
+
+
+def _yaml_escape(match) -> str:
+    """Double-quoted YAML escape for a character matched by _YAML_UNSAFE_CHARS"""
+    return f"\\u{ord(match.group()):04x}"
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a scalar as a YAML token"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 floats need a "." in the mantissa; "1e+16" would load as a string
+        mantissa, e, exponent = text.partition("e")
+        if e and "." not in mantissa:
+            text = f"{mantissa}.0e{exponent}"
+        return text
+    if isinstance(value, int):
+        return repr(value)
+    if isinstance(value, str):
+        if _YAML_PLAIN_SAFE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+            return value
+        return _YAML_UNSAFE_CHARS.sub(_yaml_escape, json.dumps(value, ensure_ascii=False))
+    raise TypeError(f"Unsupported YAML scalar type: {type(value).__name__}")
+
+
+def _yaml_lines(obj: Any, indent: int, lines: List[str]):
+    """Append block-style YAML lines for a dict or list"""
+    pad = " " * indent
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, (dict, list)) and value:
+                lines.append(f"{pad}{_yaml_scalar(key)}:")
+                _yaml_lines(value, indent + 2, lines)
+            elif isinstance(value, (dict, list)):
+                lines.append(f"{pad}{_yaml_scalar(key)}: {'{}' if isinstance(value, dict) else '[]'}")
+            else:
+                lines.append(f"{pad}{_yaml_scalar(key)}: {_yaml_scalar(value)}")
+    elif isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, (dict, list)) and item:
+                start = len(lines)
+                _yaml_lines(item, indent + 2, lines)
+                lines[start] = f"{pad}- {lines[start][indent + 2:]}"
+            elif isinstance(item, (dict, list)):
+                lines.append(f"{pad}- {'{}' if isinstance(item, dict) else '[]'}")
+            else:
+                lines.append(f"{pad}- {_yaml_scalar(item)}")
+    else:
+        raise TypeError(f"Unsupported YAML container type: {type(obj).__name__}")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return json.dumps(obj, indent=2).encode() + b"\n"
+
+
+def _fast_yaml_text(obj: Any) -> str:
+    """
+    Render fixed-shape config data as block-style YAML.
+
+    Handles only dict/list/str/int/float/bool/None, which covers every
+    artifact the construction agent emits. Raises TypeError if other
+    types are encountered.
+    """
+    lines: List[str] = []
+    _yaml_lines(obj, 0, lines)
+    return "\n".join(lines) + "\n"
+
+
+def _lexists(path) -> bool:
+    """Existence check via lstat; does not follow symlinks"""
+    try:
+        os.lstat(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _do_write(path: Path, content, mode: Optional[int] = None):
+    """Write str or bytes content to path, then apply mode if given"""
+    if isinstance(content, bytes):
+        with open(path, 'wb') as f:
+            f.write(content)
+    else:
+        with open(path, 'w') as f:
+            f.write(content)
+    if mode is not None:
+        os.chmod(path, mode)
+
+
+# Budget-tier configs have no per-repo state, so they are rendered once at import
+_PROMETHEUS_CONFIG = {
+    "global": {
+        "scrape_interval": "15s",
+        "evaluation_interval": "15s"
+    },
+    "scrape_configs": [
+        {
+            "job_name": "your-app",
+            "static_configs": [{"targets": ["localhost:8080"]}],
+            "metrics_path": "/metrics"
+        },
+        {
+            "job_name": "prometheus",
+            "static_configs": [{"targets": ["localhost:9090"]}]
+        }
+    ],
+    "rule_files": ["/etc/prometheus/rules/*.yml"]
+}
+
+_LOKI_CONFIG = {
+    "server": {
+        "http_listen_port": 3100
+    },
+    "positions": {
+        "filename": "/tmp/loki/positions.yaml"
+    },
+    "clients": [{
+        "url": "http://localhost:3100/loki/api/v1/push"
+    }],
+    "scrape_configs": [{
+        "job_name": "your-app",
+        "static_configs": [{
+            "targets": ["localhost"],
+            "labels": {"job": "your-app", "env": "dev"}
+        }]
+    }]
+}
+
+_DOCKER_COMPOSE_CONFIG = {
+    "version": "3.8",
+    "services": {
+        "prometheus": {
+            "image": "prom/prometheus:latest",
+            "ports": ["9090:9090"],
+            "volumes": ["./observability/prometheus/config.yml:/etc/prometheus/prometheus.yml"],
+            "command": "--config.file=/etc/prometheus/prometheus.yml --enable-feature=exemplar-storage"
+        },
+        "grafana": {
+            "image": "grafana/grafana:latest",
+            "ports": ["3000:3000"],
+            "environment": {
+                "GF_SECURITY_ADMIN_PASSWORD": "admin",
+                "GF_USERS_ALLOW_SIGN_UP": "false"
+            },
+            "volumes": ["grafana-storage:/var/lib/grafana"]
+        },
+        "loki": {
+            "image": "grafana/loki:latest",
+            "ports": ["3100:3100"],
+            "volumes": ["./observability/loki/config.yml:/etc/loki/local-config.yaml"]
+        },
+        "tempo": {
+            "image": "grafana/tempo:latest",
+            "ports": ["3200:3200", "4317:4317"],
+            "command": "--config.file=/etc/tempo/config.yaml"
+        }
+    },
+    "volumes": {
+        "grafana-storage": {}
+    }
+}
+
+_PROMETHEUS_YAML = _fast_yaml_text(_PROMETHEUS_CONFIG)
+_LOKI_YAML = _fast_yaml_text(_LOKI_CONFIG)
+_DOCKER_COMPOSE_YAML = _fast_yaml_text(_DOCKER_COMPOSE_CONFIG)
+
+
+# Rendered by _create_scripts into .rlc/README.md
+_README_TEMPLATE = """# RLC Setup
+
+This directory contains your Runtime LifeCycle configuration.
+
+## Quick Start
+
+### Start Observability Stack (Budget Tier)
+
+```bash
+docker-compose -f docker-compose.obs.yml up -d
+```
+
+### Verify Configuration
+
+```bash
+./.rlc/scripts/verify-config.sh
+```
+
+### Test Event Ingestion
+
+```bash
+./.rlc/scripts/test-ingestion.sh
+```
+
+## Configuration
+
+### Event Handling
+- **Tier**: {selected_tier}
+- **Metrics**: {metrics_source}
+- **Logs**: {log_source}
+- **Traces**: {trace_source}
+- **Alerts**: {alert_destination}
+
+### Environment
+- **Platform**: {compute_platform}
+- **Provider**: {cloud_provider}
+- **Languages**: {languages}
+
+## Agents
+
+The following RLC agents are configured:
+
+{agents_block}
+
+## Next Steps
+
+1. Configure your credentials in the appropriate `.env.*` files
+2. Start the observability stack
+3. Run the verification scripts
+4. Deploy your application with instrumentation
+
+## Documentation
+
+See the main RLC documentation for more details on agent capabilities.
+"""
+
 
 @dataclass
 class ConstructionConfig:
@@ -27,6 +310,7 @@ class ConstructionConfig:
     dry_run: bool = False
     skip_code_instrumentation: bool = False
     skip_ci_integration: bool = False
+    json_output: bool = False
 
 
 class RLCConstructionAgent:
@@ -34,8 +318,18 @@ class RLCConstructionAgent:
 
     def __init__(self, config: ConstructionConfig):
         self.config = config
-        self.repo_root = Path(config.repo_root).resolve()
-        self.setup_dir = Path(config.setup_dir).resolve()
+        self.repo_root = Path(os.path.abspath(config.repo_root))
+        self.setup_dir = Path(os.path.abspath(config.setup_dir))
+        self._repo_root_str = os.fspath(self.repo_root)
+        self._repo_root_prefix = self._repo_root_str + os.sep
+        self._dependencies: Optional[frozenset] = None
+        # (path, content, mode) written in one batch by _flush_writes
+        self._pending_writes: List[tuple] = []
+        # Repo-relative paths this run has written, so validation can skip stat-ing them
+        self._created_artifacts: set = set()
+        # Result dict of the phase running on the current thread; its writes, file
+        # edits and step messages are held there until build_async merges the phases
+        self._phase_state = threading.local()
 
         # Load prescriptions
         self.rlc_config = self._load_yaml(self.setup_dir / "rlc-config.yaml")
@@ -46,16 +340,55 @@ class RLCConstructionAgent:
         self.event_handling = self.event_setup.get("primary_option", {})
         self.selected_tier = self.event_setup.get("selected_tier", "balanced")
 
+        # Ordered list for rendered output, set for membership checks
+        self._language_list = list(self.environment.get("languages") or ())
+        self.languages = frozenset(self._language_list)
+        self._lang_bits = 0
+        for lang in self.languages:
+            self._lang_bits |= _LANGUAGE_BITS.get(lang, 0)
+        self._primary_lang = next(
+            (lang for lang in _LANGUAGE_PRIORITY if lang in self.languages), None
+        )
+
+        # Shared by every agent config; each agent is dumped to its own file
+        self._env_block = {
+            "compute_platform": self.environment.get("compute_platform", "unknown"),
+            "cloud_provider": self.environment.get("cloud_provider", "unknown"),
+            "languages": self._language_list
+        }
+
     def _load_yaml(self, path: Path) -> Dict:
         """Load YAML file safely"""
         if not path.exists():
             raise FileNotFoundError(f"Required file not found: {path}")
 
+        use_cache = os.environ.get("RLC_YAML_CACHE") == "1"
+        if use_cache:
+            key = (str(path.resolve()), path.stat().st_mtime_ns)
+            if key in _YAML_CACHE:
+                return copy.deepcopy(_YAML_CACHE[key])
+
         with open(path, 'r') as f:
-            return yaml.safe_load(f)
+            data = yaml.load(f, Loader=_Loader)
+
+        if use_cache:
+            _YAML_CACHE[key] = data
+            return copy.deepcopy(data)
+        return data
 
     def build(self) -> Dict[str, Any]:
         """Execute the full construction process"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.build_async())
+        # asyncio.run() can't nest inside a running loop, so build on a private loop
+        # in a worker thread and block until it finishes
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.build_async()).result()
+
+    async def build_async(self) -> Dict[str, Any]:
+        """Execute the construction process, overlapping independent phases"""
 
         results = {
             "steps": [],
@@ -67,28 +400,51 @@ class RLCConstructionAgent:
             # Phase 1: Create RLC directory structure
             self._create_rlc_structure(results)
 
-            # Phase 2: Setup event handling infrastructure
-            self._setup_event_handling(results)
-
-            # Phase 3: Configure agents
-            self._configure_agents(results)
-
-            # Phase 3.5: Configure AI models for agents
-            self._configure_agent_models(results)
-
-            # Phase 4: Codebase integration (optional)
+            # Phases 2-6 write disjoint files, so run them concurrently
+            phases = [
+                self._setup_event_handling,      # Phase 2: event handling infrastructure
+                self._configure_agents,          # Phase 3: agents
+                self._configure_agent_models,    # Phase 3.5: AI models for agents
+            ]
             if not self.config.skip_code_instrumentation:
-                self._integrate_codebase(results)
-
-            # Phase 5: CI/CD integration (optional)
+                phases.append(self._integrate_codebase)    # Phase 4 (optional)
             if not self.config.skip_ci_integration:
-                self._integrate_ci_cd(results)
+                phases.append(self._integrate_ci_cd)       # Phase 5 (optional)
+            phases.append(self._create_scripts)            # Phase 6: utility scripts
 
-            # Phase 6: Create utility scripts
-            self._create_scripts(results)
+            phase_results = [
+                {"steps": [], "artifacts": [], "writes": [], "edits": []} for _ in phases
+            ]
+            loop = asyncio.get_running_loop()
+            outcomes = await asyncio.gather(
+                *(loop.run_in_executor(None, self._run_phase, phase, phase_result)
+                  for phase, phase_result in zip(phases, phase_results)),
+                return_exceptions=True
+            )
+
+            # Apply phases in order, stopping after the first failure, so output,
+            # files and results match a sequential build
+            error = None
+            for phase_result, outcome in zip(phase_results, outcomes):
+                for entry in phase_result["steps"]:
+                    print(f"  ✓ {entry['message']}")
+                results["steps"].extend(phase_result["steps"])
+                results["artifacts"].extend(phase_result["artifacts"])
+                self._pending_writes.extend(phase_result["writes"])
+                for edit, args in phase_result["edits"]:
+                    edit(*args)
+                if isinstance(outcome, Exception):
+                    error = outcome
+                    break
+
+            # Write out what the applied phases produced, including a failed phase's
+            # writes up to the point it raised
+            await self._flush_writes()
+            if error is not None:
+                raise error
 
             # Phase 7: Validate setup
-            validation = self._validate_setup()
+            validation = self._validate_setup(known_present=self._created_artifacts)
             results["validation"] = validation
 
             if validation["status"] == "pass":
@@ -114,9 +470,28 @@ class RLCConstructionAgent:
             self.repo_root / "observability" / "loki",
         ]
 
+        # Every other directory a later phase writes into; created here so the
+        # write helpers can assume parents exist
+        support_dirs = []
+        if self._primary_lang == "rust":
+            support_dirs.append(self.repo_root / "observability" / "src")
+
+        # Create shallowest directories first; once a parent is known to exist
+        # a single mkdir suffices instead of re-walking every ancestor
+        created = set()
+        for directory in sorted(set(directories + support_dirs), key=lambda d: len(d.parts)):
+            if directory.parent in created:
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    pass
+            else:
+                os.makedirs(directory, exist_ok=True)
+                created.update(directory.parents)
+            created.add(directory)
+
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            results["artifacts"].append(f"dir:{directory.relative_to(self.repo_root)}")
+            results["artifacts"].append(f"dir:{self._rel(directory)}")
 
         self._log_step(step, "Created RLC directory structure", results)
 
@@ -136,106 +511,26 @@ class RLCConstructionAgent:
 
     def _setup_budget_tier(self, results: Dict):
         """Setup self-hosted LGTM stack"""
-        languages = self.environment.get("languages", [])
-
         # Prometheus configuration
-        prometheus_config = {
-            "global": {
-                "scrape_interval": "15s",
-                "evaluation_interval": "15s"
-            },
-            "scrape_configs": [
-                {
-                    "job_name": "your-app",
-                    "static_configs": [{"targets": ["localhost:8080"]}],
-                    "metrics_path": "/metrics"
-                },
-                {
-                    "job_name": "prometheus",
-                    "static_configs": [{"targets": ["localhost:9090"]}]
-                }
-            ],
-            "rule_files": ["/etc/prometheus/rules/*.yml"]
-        }
-
         prometheus_file = self.repo_root / "observability" / "prometheus" / "config.yml"
-        self._write_yaml(prometheus_file, prometheus_config)
-        results["artifacts"].append(f"file:{prometheus_file.relative_to(self.repo_root)}")
+        self._write_static_yaml(prometheus_file, _PROMETHEUS_CONFIG, _PROMETHEUS_YAML)
+        results["artifacts"].append(f"file:{self._rel(prometheus_file)}")
 
         # Loki configuration
-        loki_config = {
-            "server": {
-                "http_listen_port": 3100
-            },
-            "positions": {
-                "filename": "/tmp/loki/positions.yaml"
-            },
-            "clients": [{
-                "url": "http://localhost:3100/loki/api/v1/push"
-            }],
-            "scrape_configs": [{
-                "job_name": "your-app",
-                "static_configs": [{
-                    "targets": ["localhost"],
-                    "labels": {"job": "your-app", "env": "dev"}
-                }]
-            }]
-        }
-
         loki_file = self.repo_root / "observability" / "loki" / "config.yml"
-        self._write_yaml(loki_file, loki_config)
-        results["artifacts"].append(f"file:{loki_file.relative_to(self.repo_root)}")
+        self._write_static_yaml(loki_file, _LOKI_CONFIG, _LOKI_YAML)
+        results["artifacts"].append(f"file:{self._rel(loki_file)}")
 
         # Docker Compose for local observability
-        docker_compose = {
-            "version": "3.8",
-            "services": {
-                "prometheus": {
-                    "image": "prom/prometheus:latest",
-                    "ports": ["9090:9090"],
-                    "volumes": ["./observability/prometheus/config.yml:/etc/prometheus/prometheus.yml"],
-                    "command": "--config.file=/etc/prometheus/prometheus.yml --enable-feature=exemplar-storage"
-                },
-                "grafana": {
-                    "image": "grafana/grafana:latest",
-                    "ports": ["3000:3000"],
-                    "environment": {
-                        "GF_SECURITY_ADMIN_PASSWORD": "admin",
-                        "GF_USERS_ALLOW_SIGN_UP": "false"
-                    },
-                    "volumes": ["grafana-storage:/var/lib/grafana"]
-                },
-                "loki": {
-                    "image": "grafana/loki:latest",
-                    "ports": ["3100:3100"],
-                    "volumes": ["./observability/loki/config.yml:/etc/loki/local-config.yaml"]
-                },
-                "tempo": {
-                    "image": "grafana/tempo:latest",
-                    "ports": ["3200:3200", "4317:4317"],
-                    "command": "--config.file=/etc/tempo/config.yaml"
-                }
-            },
-            "volumes": {
-                "grafana-storage": {}
-            }
-        }
-
         compose_file = self.repo_root / "docker-compose.obs.yml"
-        self._write_yaml(compose_file, docker_compose)
-        results["artifacts"].append(f"file:{compose_file.relative_to(self.repo_root)}")
+        self._write_static_yaml(compose_file, _DOCKER_COMPOSE_CONFIG, _DOCKER_COMPOSE_YAML)
+        results["artifacts"].append(f"file:{self._rel(compose_file)}")
 
         # Add observability dependency based on language
-        if "python" in languages:
-            self._add_python_observability_deps(results)
-        elif "rust" in languages:
-            self._add_rust_observability_deps(results)
-        elif "javascript" in languages or "typescript" in languages:
-            self._add_js_observability_deps(results)
+        self._add_observability_deps(results)
 
     def _setup_balanced_tier(self, results: Dict):
         """Setup Grafana Cloud (or similar managed service)"""
-        languages = self.environment.get("languages", [])
 
         # Grafana Cloud environment template
         grafana_env = """# Grafana Cloud Configuration
@@ -248,66 +543,60 @@ GRAFANA_CLOUD_TEMPO_URL=https://tempo-{instance}.grafana.net
 """
 
         env_file = self.repo_root / ".env.grafana"
+        self._add_file_content(env_file, grafana_env)
+        results["artifacts"].append(f"file:{self._rel(env_file)}")
+
+        agent_file = self.repo_root / "observability" / "grafana-agent.yml"
         if not self.config.dry_run:
-            with open(env_file, 'w') as f:
-                f.write(grafana_env)
-        results["artifacts"].append(f"file:{env_file.relative_to(self.repo_root)}")
-
-        # Grafana Agent configuration
-        grafana_agent_config = {
-            "server": {"http_listen_port": 12345},
-            "metrics": {
-                "global": {"scrape_interval": "60s"},
-                "configs": [{
-                    "name": "default",
-                    "scrape_configs": [{
-                        "job_name": "your-app",
-                        "static_configs": [{"targets": ["localhost:8080"]}]
-                    }],
-                    "remote_write": [{
-                        "url": "${GRAFANA_CLOUD_PROM_URL}/api/prom/push",
-                        "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
+            # Grafana Agent configuration
+            grafana_agent_config = {
+                "server": {"http_listen_port": 12345},
+                "metrics": {
+                    "global": {"scrape_interval": "60s"},
+                    "configs": [{
+                        "name": "default",
+                        "scrape_configs": [{
+                            "job_name": "your-app",
+                            "static_configs": [{"targets": ["localhost:8080"]}]
+                        }],
+                        "remote_write": [{
+                            "url": "${GRAFANA_CLOUD_PROM_URL}/api/prom/push",
+                            "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
+                        }]
                     }]
-                }]
-            },
-            "logs": {
-                "configs": [{
-                    "name": "default",
-                    "clients": [{
-                        "url": "${GRAFANA_CLOUD_LOKI_URL}/loki/api/v1/push",
-                        "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
-                    }],
-                    "scrape_configs": [{
-                        "job_name": "your-app",
-                        "static_configs": [{
-                            "targets": ["localhost"],
-                            "labels": {"job": "your-app", "env": os.environ.get("ENV", "dev")}
+                },
+                "logs": {
+                    "configs": [{
+                        "name": "default",
+                        "clients": [{
+                            "url": "${GRAFANA_CLOUD_LOKI_URL}/loki/api/v1/push",
+                            "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
+                        }],
+                        "scrape_configs": [{
+                            "job_name": "your-app",
+                            "static_configs": [{
+                                "targets": ["localhost"],
+                                "labels": {"job": "your-app", "env": os.environ.get("ENV", "dev")}
+                            }]
                         }]
                     }]
-                }]
-            },
-            "traces": {
-                "configs": [{
-                    "name": "default",
-                    "remote_write": [{
-                        "endpoint": "${GRAFANA_CLOUD_TEMPO_URL}",
-                        "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
+                },
+                "traces": {
+                    "configs": [{
+                        "name": "default",
+                        "remote_write": [{
+                            "endpoint": "${GRAFANA_CLOUD_TEMPO_URL}",
+                            "headers": {"Authorization": "Bearer ${GRAFANA_API_KEY}"}
+                        }]
                     }]
-                }]
+                }
             }
-        }
 
-        agent_file = self.repo_root / "observability" / "grafana-agent.yml"
-        self._write_yaml(agent_file, grafana_agent_config)
-        results["artifacts"].append(f"file:{agent_file.relative_to(self.repo_root)}")
+            self._write_structured(agent_file, grafana_agent_config)
+        results["artifacts"].append(f"file:{self._rel(agent_file)}")
 
         # Language-specific instrumentation
-        if "python" in languages:
-            self._add_python_observability_deps(results, managed=True)
-        elif "rust" in languages:
-            self._add_rust_observability_deps(results, managed=True)
-        elif "javascript" in languages or "typescript" in languages:
-            self._add_js_observability_deps(results, managed=True)
+        self._add_observability_deps(results, managed=True)
 
     def _setup_premium_tier(self, results: Dict):
         """Setup premium observability (Datadog, New Relic, etc.)"""
@@ -323,7 +612,6 @@ GRAFANA_CLOUD_TEMPO_URL=https://tempo-{instance}.grafana.net
 
     def _setup_datadog(self, results: Dict):
         """Setup Datadog integration"""
-        languages = self.environment.get("languages", [])
 
         datadog_config = {
             "api_key": "${DD_API_KEY}",
@@ -334,11 +622,11 @@ GRAFANA_CLOUD_TEMPO_URL=https://tempo-{instance}.grafana.net
         }
 
         datadog_file = self.repo_root / "observability" / "datadog.yaml"
-        self._write_yaml(datadog_file, datadog_config)
-        results["artifacts"].append(f"file:{datadog_file.relative_to(self.repo_root)}")
+        self._write_structured(datadog_file, datadog_config)
+        results["artifacts"].append(f"file:{self._rel(datadog_file)}")
 
         # Add Datadog dependencies
-        if "python" in languages:
+        if self._lang_bits & _PYTHON_BIT:
             self._add_file_content(
                 self.repo_root / "observability" / "requirements-datadog.txt",
                 "datadog-lambda==4.76.0\ndatadog==0.44.0\n"
@@ -347,7 +635,6 @@ GRAFANA_CLOUD_TEMPO_URL=https://tempo-{instance}.grafana.net
 
     def _setup_new_relic(self, results: Dict):
         """Setup New Relic integration"""
-        languages = self.environment.get("languages", [])
 
         newrelic_config = {
             "license_key": "${NEW_RELIC_LICENSE_KEY}",
@@ -356,8 +643,19 @@ GRAFANA_CLOUD_TEMPO_URL=https://tempo-{instance}.grafana.net
         }
 
         newrelic_file = self.repo_root / "observability" / "newrelic.yaml"
-        self._write_yaml(newrelic_file, newrelic_config)
-        results["artifacts"].append(f"file:{newrelic_file.relative_to(self.repo_root)}")
+        self._write_structured(newrelic_file, newrelic_config)
+        results["artifacts"].append(f"file:{self._rel(newrelic_file)}")
+
+    def _add_observability_deps(self, results: Dict, managed: bool = False):
+        """Add observability dependencies for the primary language"""
+        handler = {
+            "python": self._add_python_observability_deps,
+            "rust": self._add_rust_observability_deps,
+            "javascript": self._add_js_observability_deps,
+            "typescript": self._add_js_observability_deps,
+        }.get(self._primary_lang)
+        if handler:
+            handler(results, managed=managed)
 
     def _add_python_observability_deps(self, results: Dict, managed: bool = False):
         """Add Python observability dependencies"""
@@ -376,7 +674,7 @@ prometheus-client==0.19.0
 
         req_file = self.repo_root / "observability" / "requirements.txt"
         self._add_file_content(req_file, requirements)
-        results["artifacts"].append(f"file:{req_file.relative_to(self.repo_root)}")
+        results["artifacts"].append(f"file:{self._rel(req_file)}")
 
     def _add_rust_observability_deps(self, results: Dict, managed: bool = False):
         """Add Rust observability dependencies"""
@@ -393,7 +691,7 @@ metrics = "0.21"
 
         cargo_file = self.repo_root / "observability" / "Cargo.toml.snippet"
         self._add_file_content(cargo_file, cargo_snippet)
-        results["artifacts"].append(f"file:{cargo_file.relative_to(self.repo_root)}")
+        results["artifacts"].append(f"file:{self._rel(cargo_file)}")
 
         # Rust instrumentation module
         rust_module = """use opentelemetry::global;
@@ -425,9 +723,8 @@ pub fn init_metrics() {
 }
 """
         tracing_file = self.repo_root / "observability" / "src" / "instrumentation.rs"
-        tracing_file.parent.mkdir(parents=True, exist_ok=True)
         self._add_file_content(tracing_file, rust_module)
-        results["artifacts"].append(f"file:{tracing_file.relative_to(self.repo_root)}")
+        results["artifacts"].append(f"file:{self._rel(tracing_file)}")
 
     def _add_js_observability_deps(self, results: Dict, managed: bool = False):
         """Add JavaScript/TypeScript observability dependencies"""
@@ -443,7 +740,7 @@ pub fn init_metrics() {
 """
         package_file = self.repo_root / "observability" / "package.json"
         self._add_file_content(package_file, package_json)
-        results["artifacts"].append(f"file:{package_file.relative_to(self.repo_root)}")
+        results["artifacts"].append(f"file:{self._rel(package_file)}")
 
     def _configure_agents(self, results: Dict):
         """Configure RLC agents based on prescription"""
@@ -460,23 +757,26 @@ pub fn init_metrics() {
                 "auto-remediator"
             ]
 
+        # Agent files are queued and written concurrently with the other pending writes
         for agent_name in priority_agents:
-            agent_config = self._generate_agent_config(agent_name)
-            agent_file = self.repo_root / ".rlc" / "agents" / f"{agent_name}.yaml"
-            self._write_yaml(agent_file, agent_config)
+            if not self.config.dry_run:
+                agent_config = self._generate_agent_config(agent_name)
+                agent_file = self.repo_root / ".rlc" / "agents" / f"{agent_name}.yaml"
+                self._write_structured(agent_file, agent_config)
             results["artifacts"].append(f"file:.rlc/agents/{agent_name}.yaml")
 
         # Create communication config
-        comm_config = self._generate_comm_config()
-        comm_file = self.repo_root / ".rlc" / "agents" / "communication.yaml"
-        self._write_yaml(comm_file, comm_config)
+        if not self.config.dry_run:
+            comm_config = self._generate_comm_config()
+            comm_file = self.repo_root / ".rlc" / "agents" / "communication.yaml"
+            self._write_structured(comm_file, comm_config)
         results["artifacts"].append(f"file:.rlc/agents/communication.yaml")
 
         # Copy gates configuration
         gates_source = self.setup_dir / "rlc-config.yaml"
         gates_dest = self.repo_root / ".rlc" / "config" / "gates.yaml"
         if gates_source.exists():
-            shutil.copy(gates_source, gates_dest)
+            self._copy_if_changed(gates_source, gates_dest)
             results["artifacts"].append("file:.rlc/config/gates.yaml")
 
         self._log_step(step, f"Configured {len(priority_agents)} agents", results)
@@ -489,11 +789,7 @@ pub fn init_metrics() {
                 "enabled": True,
                 "version": "1.0.0"
             },
-            "environment": {
-                "compute_platform": self.environment.get("compute_platform", "unknown"),
-                "cloud_provider": self.environment.get("cloud_provider", "unknown"),
-                "languages": self.environment.get("languages", [])
-            }
+            "environment": self._env_block
         }
 
         # Agent-specific configurations
@@ -593,24 +889,26 @@ pub fn init_metrics() {
         """Configure AI models for each agent"""
         step = "configure_agent_models"
 
-        # Get model configuration template
-        model_config = self._get_tiered_model_config()
+        if not self.config.dry_run:
+            # Get model configuration template
+            model_config = self._get_tiered_model_config()
 
-        # Write agent model configuration
-        models_file = self.repo_root / ".rlc" / "config" / "agent-models.yaml"
-        self._write_yaml(models_file, model_config)
-        results["artifacts"].append("file:.rlc/config/agent-models.yaml")
+            # Write agent model configuration
+            models_file = self.repo_root / ".rlc" / "config" / "agent-models.yaml"
+            self._write_yaml(models_file, model_config)
 
-        # Create model setup script
-        setup_script = self._generate_model_setup_script(model_config)
-        script_file = self.repo_root / ".rlc" / "scripts" / "setup-models.sh"
-        self._write_script(script_file, setup_script)
-        results["artifacts"].append("file:.rlc/scripts/setup-models.sh")
+            # Create model setup script
+            setup_script = self._generate_model_setup_script(model_config)
+            script_file = self.repo_root / ".rlc" / "scripts" / "setup-models.sh"
+            self._write_script(script_file, setup_script)
 
-        # Create MCP configuration
-        mcp_config = self._generate_mcp_config()
-        mcp_file = self.repo_root / ".rlc" / "config" / "mcp-servers.yaml"
-        self._write_yaml(mcp_file, mcp_config)
+            # Create MCP configuration
+            mcp_config = self._generate_mcp_config()
+            mcp_file = self.repo_root / ".rlc" / "config" / "mcp-servers.yaml"
+            self._write_yaml(mcp_file, mcp_config)
+
+        results["artifacts"].append("file:.rlc/config/agent-models.yaml")
+        results["artifacts"].append("file:.rlc/scripts/setup-models.sh")
         results["artifacts"].append("file:.rlc/config/mcp-servers.yaml")
 
         self._log_step(step, "Configured AI models and MCP servers", results)
@@ -911,21 +1209,16 @@ echo "  ollama run {list(models)[0] if models else 'llama3.2:3b'}"
     def _integrate_codebase(self, results: Dict):
         """Add observability instrumentation to existing code"""
         step = "integrate_codebase"
-        languages = self.environment.get("languages", [])
-
         changes_made = []
 
-        if "python" in languages:
-            changes = self._integrate_python_codebase()
-            changes_made.extend(changes)
-
-        if "rust" in languages:
-            changes = self._integrate_rust_codebase()
-            changes_made.extend(changes)
-
-        if "javascript" in languages or "typescript" in languages:
-            changes = self._integrate_js_codebase()
-            changes_made.extend(changes)
+        integrations = (
+            (_PYTHON_BIT, self._integrate_python_codebase),
+            (_RUST_BIT, self._integrate_rust_codebase),
+            (_JS_BIT | _TS_BIT, self._integrate_js_codebase),
+        )
+        for mask, integrate in integrations:
+            if self._lang_bits & mask:
+                changes_made.extend(integrate())
 
         for change in changes_made:
             results["artifacts"].append(f"instrumentation:{change}")
@@ -935,10 +1228,11 @@ echo "  ollama run {list(models)[0] if models else 'llama3.2:3b'}"
     def _integrate_python_codebase(self) -> List[str]:
         """Integrate observability into Python codebase"""
         changes = []
+        top = self._top_level_names()
 
         # Look for main.py or app.py
         for main_file in ["main.py", "app.py", "wsgi.py", "asgi.py"]:
-            if (self.repo_root / main_file).exists():
+            if main_file in top:
                 # Add instrumentation import
                 instrumentation_code = """
 
@@ -987,10 +1281,11 @@ fn main() {
     def _integrate_js_codebase(self) -> List[str]:
         """Integrate observability into JavaScript/TypeScript codebase"""
         changes = []
+        top = self._top_level_names()
 
         # Look for index files
         for index_file in ["index.js", "index.ts", "server.js", "server.ts"]:
-            if (self.repo_root / index_file).exists():
+            if index_file in top:
                 instrumentation = """
 
 // RLC Observability
@@ -1106,96 +1401,64 @@ fi
         results["artifacts"].append("file:.rlc/scripts/test-ingestion.sh")
 
         # README for the setup
-        readme = f"""# RLC Setup
-
-This directory contains your Runtime LifeCycle configuration.
-
-## Quick Start
-
-### Start Observability Stack (Budget Tier)
-
-```bash
-docker-compose -f docker-compose.obs.yml up -d
-```
-
-### Verify Configuration
-
-```bash
-./.rlc/scripts/verify-config.sh
-```
-
-### Test Event Ingestion
-
-```bash
-./.rlc/scripts/test-ingestion.sh
-```
-
-## Configuration
-
-### Event Handling
-- **Tier**: {self.selected_tier}
-- **Metrics**: {self.event_handling.get('metrics_source', 'N/A')}
-- **Logs**: {self.event_handling.get('log_source', 'N/A')}
-- **Traces**: {self.event_handling.get('trace_source', 'N/A')}
-- **Alerts**: {self.event_handling.get('alert_destination', 'N/A')}
-
-### Environment
-- **Platform**: {self.environment.get('compute_platform', 'unknown')}
-- **Provider**: {self.environment.get('cloud_provider', 'unknown')}
-- **Languages**: {', '.join(self.environment.get('languages', []))}
-
-## Agents
-
-The following RLC agents are configured:
-
-"""
-        for agent in self.agents.get("core", []):
-            readme += f"- **{agent}**: Core agent\n"
-
-        readme += """
-
-## Next Steps
-
-1. Configure your credentials in the appropriate `.env.*` files
-2. Start the observability stack
-3. Run the verification scripts
-4. Deploy your application with instrumentation
-
-## Documentation
-
-See the main RLC documentation for more details on agent capabilities.
-"""
+        agents_block = "".join(f"- **{agent}**: Core agent\n" for agent in self.agents.get("core", []))
+        readme = _README_TEMPLATE.format_map({
+            "selected_tier": self.selected_tier,
+            "metrics_source": self.event_handling.get('metrics_source', 'N/A'),
+            "log_source": self.event_handling.get('log_source', 'N/A'),
+            "trace_source": self.event_handling.get('trace_source', 'N/A'),
+            "alert_destination": self.event_handling.get('alert_destination', 'N/A'),
+            "compute_platform": self.environment.get('compute_platform', 'unknown'),
+            "cloud_provider": self.environment.get('cloud_provider', 'unknown'),
+            "languages": ', '.join(self._language_list),
+            "agents_block": agents_block,
+        })
 
         readme_file = self.repo_root / ".rlc" / "README.md"
-        if not self.config.dry_run:
-            with open(readme_file, 'w') as f:
-                f.write(readme)
+        self._add_file_content(readme_file, readme)
         results["artifacts"].append("file:.rlc/README.md")
 
         self._log_step(step, "Created utility scripts", results)
 
-    def _validate_setup(self) -> Dict[str, Any]:
-        """Validate the RLC setup"""
+    def _validate_setup(self, known_present: Optional[set] = None) -> Dict[str, Any]:
+        """
+        Validate the RLC setup.
+
+        Repo-relative paths in known_present were written by this run and
+        are not checked on disk again.
+        """
         checks = []
 
-        # Check configuration files
         required_configs = [
             ".rlc/config/gates.yaml",
             ".rlc/agents/communication.yaml",
             ".rlc/README.md"
         ]
+        observability_files = [
+            "observability/prometheus/config.yml",
+            "observability/loki/config.yml"
+        ]
+        scripts = [
+            ".rlc/scripts/verify-config.sh",
+            ".rlc/scripts/test-ingestion.sh"
+        ]
+        known_present = known_present or set()
+        expected = required_configs + observability_files + scripts
+        present = self._exists_many([p for p in expected if p not in known_present])
+        present.update((p, True) for p in expected if p in known_present)
 
+        # Check configuration files
         for config in required_configs:
-            exists = (self.repo_root / config).exists()
+            exists = present[config]
             checks.append({
                 "name": f"config_exists:{config}",
                 "status": "pass" if exists else "fail"
             })
 
         # Check agent configs
-        agent_dir = self.repo_root / ".rlc" / "agents"
-        if agent_dir.exists():
-            agent_configs = list(agent_dir.glob("*.yaml"))
+        agent_dir = os.path.join(self._repo_root_str, ".rlc", "agents")
+        if _lexists(agent_dir):
+            agent_configs = list(Path(agent_dir).glob("*.yaml"))
             checks.append({
                 "name": "agent_configs_count",
                 "status": "pass" if len(agent_configs) >= 3 else "warning",
@@ -1203,26 +1466,16 @@ See the main RLC documentation for more details on agent capabilities.
             })
 
         # Check observability setup
-        observability_files = [
-            "observability/prometheus/config.yml",
-            "observability/loki/config.yml"
-        ]
-
         for obs_file in observability_files:
-            exists = (self.repo_root / obs_file).exists()
+            exists = present[obs_file]
             checks.append({
                 "name": f"observability_exists:{obs_file}",
                 "status": "pass" if exists else "warning"
             })
 
         # Check scripts
-        scripts = [
-            ".rlc/scripts/verify-config.sh",
-            ".rlc/scripts/test-ingestion.sh"
-        ]
-
         for script in scripts:
-            exists = (self.repo_root / script).exists()
+            exists = present[script]
             checks.append({
                 "name": f"script_exists:{script}",
                 "status": "pass" if exists else "warning"
@@ -1246,52 +1499,166 @@ See the main RLC documentation for more details on agent capabilities.
         }
 
     # Helper methods
+    # Parent directories are created up front by _create_rlc_structure
+
+    def _run_phase(self, phase, phase_result: Dict):
+        """Run a construction phase on a worker thread, holding its file operations"""
+        self._phase_state.result = phase_result
+        try:
+            phase(phase_result)
+        finally:
+            self._phase_state.result = None
+
+    def _defer_edit(self, edit, *args) -> bool:
+        """Hold an in-place file operation until its phase is merged; False outside a phase"""
+        phase_result = getattr(self._phase_state, "result", None)
+        if phase_result is None:
+            return False
+        phase_result["edits"].append((edit, args))
+        return True
+
+    def _queue_write(self, path: Path, content, mode: Optional[int] = None):
+        """Queue file content (str or bytes) for the batched write in _flush_writes"""
+        if not self.config.dry_run:
+            phase_result = getattr(self._phase_state, "result", None)
+            pending = self._pending_writes if phase_result is None else phase_result["writes"]
+            pending.append((path, content, mode))
+
+    async def _flush_writes(self):
+        """Write all queued files concurrently"""
+        pending, self._pending_writes = self._pending_writes, []
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, _do_write, *write) for write in pending))
+        self._created_artifacts.update(self._rel_posix(path) for path, _, _ in pending)
 
     def _write_yaml(self, path: Path, data: Dict):
         """Write YAML file"""
-        if not self.config.dry_run:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        if self.config.dry_run:
+            return
+        # RLC_YAML_PYDUMP=1 forces PyYAML output, e.g. to diff against the fast emitter
+        if os.environ.get("RLC_YAML_PYDUMP") != "1":
+            try:
+                self._queue_write(path, _fast_yaml_text(data))
+                return
+            except TypeError:
+                pass
+        self._queue_write(path, yaml.dump(data, Dumper=_Dumper, default_flow_style=False, sort_keys=False))
+
+    def _write_structured(self, path: Path, data: Dict):
+        """Write a machine-consumed config, as JSON when json_output is enabled"""
+        if self.config.json_output and self._rel(path).startswith(_JSON_OUTPUT_DIRS):
+            if not self.config.dry_run:
+                self._queue_write(path, _json_dumps(data))
+            return
+        self._write_yaml(path, data)
+
+    def _write_static_yaml(self, path: Path, data: Dict, rendered: str):
+        """Write a pre-rendered YAML config, re-serializing only when output settings require it"""
+        if self.config.json_output or os.environ.get("RLC_YAML_PYDUMP") == "1":
+            self._write_structured(path, data)
+        else:
+            self._add_file_content(path, rendered)
 
     def _write_script(self, path: Path, content: str):
         """Write executable script"""
-        if not self.config.dry_run:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                f.write(content)
-            os.chmod(path, 0o755)
+        self._queue_write(path, content, 0o755)
 
     def _add_file_content(self, path: Path, content: str):
         """Add content to a file"""
-        if not self.config.dry_run:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                f.write(content)
+        self._queue_write(path, content)
+
+    def _copy_if_changed(self, source: Path, dest: Path):
+        """Copy file contents unless dest already matches source size and mtime"""
+        if self._defer_edit(self._copy_if_changed, source, dest):
+            return
+        src_stat = source.stat()
+        try:
+            dest_stat = dest.stat()
+            if (dest_stat.st_size == src_stat.st_size
+                    and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                self._created_artifacts.add(self._rel_posix(dest))
+                return
+        except FileNotFoundError:
+            pass
+        import shutil
+        shutil.copyfile(source, dest)
+        # Carry the source mtime over so the next run can skip the copy
+        os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        self._created_artifacts.add(self._rel_posix(dest))
 
     def _append_to_file(self, path: Path, content: str):
         """Append content to an existing file"""
+        if self._defer_edit(self._append_to_file, path, content):
+            return
         if not self.config.dry_run and path.exists():
             with open(path, 'a') as f:
                 f.write(content)
 
+    def _exists_many(self, rel_paths: List[str]) -> Dict[str, bool]:
+        """Check repo-relative paths for existence with one scandir per parent directory"""
+        by_parent: Dict[str, List[str]] = {}
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition("/")
+            by_parent.setdefault(parent, []).append(name)
+
+        present = {}
+        for parent, names in by_parent.items():
+            try:
+                with os.scandir(os.path.join(self._repo_root_str, parent)) as it:
+                    listing = {entry.name for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                listing = set()
+            for name in names:
+                present[f"{parent}/{name}" if parent else name] = name in listing
+        return present
+
+    def _rel_posix(self, path: Path) -> str:
+        """Repo-relative path with forward slashes, matching _validate_setup's keys"""
+        return self._rel(path).replace(os.sep, "/")
+
+    def _rel(self, path: Path) -> str:
+        """Path relative to the repo root, via string slicing when possible"""
+        path_str = str(path)
+        if path_str.startswith(self._repo_root_prefix):
+            return path_str[len(self._repo_root_prefix):]
+        return str(path.relative_to(self.repo_root))
+
+    def _top_level_names(self) -> set:
+        """Names of entries directly under the repo root (one directory read)"""
+        try:
+            with os.scandir(self.repo_root) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
+    def _load_dependencies(self) -> frozenset:
+        """Parse requirements.txt and package.json once into a set of lowercased package names"""
+        if self._dependencies is None:
+            names = set()
+
+            req_file = self.repo_root / "requirements.txt"
+            if req_file.exists():
+                names.update(_REQUIREMENT_NAME.findall(req_file.read_text()))
+
+            pkg_file = self.repo_root / "package.json"
+            if pkg_file.exists():
+                try:
+                    package = json.loads(pkg_file.read_text())
+                except json.JSONDecodeError:
+                    package = {}
+                if not isinstance(package, dict):
+                    package = {}
+                for section in ("dependencies", "devDependencies"):
+                    names.update(package.get(section) or {})
+
+            self._dependencies = frozenset(name.lower() for name in names)
+        return self._dependencies
+
     def _has_dependency(self, package: str) -> bool:
         """Check if a dependency exists in the codebase"""
-        # Check requirements.txt
-        req_file = self.repo_root / "requirements.txt"
-        if req_file.exists():
-            content = req_file.read_text().lower()
-            if package.lower() in content:
-                return True
-
-        # Check package.json
-        pkg_file = self.repo_root / "package.json"
-        if pkg_file.exists():
-            content = pkg_file.read_text().lower()
-            if package.lower() in content:
-                return True
-
-        return False
+        return package.lower() in self._load_dependencies()
 
     def _log_step(self, step: str, message: str, results: Dict):
         """Log a construction step"""
@@ -1299,11 +1666,15 @@ See the main RLC documentation for more details on agent capabilities.
             "step": step,
             "message": message
         })
-        print(f"  ✓ {message}")
+        # Inside a phase, build_async prints the step when the phase is merged
+        if getattr(self._phase_state, "result", None) is None:
+            print(f"  ✓ {message}")
 
 
 def main():
     """CLI entry point"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="RLC Construction Agent - Build event handling infrastructure"
     )
@@ -1313,6 +1684,8 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
     parser.add_argument("--skip-code", action="store_true", help="Skip codebase instrumentation")
     parser.add_argument("--skip-ci", action="store_true", help="Skip CI/CD integration")
+    parser.add_argument("--json-output", action="store_true",
+                        help="Write machine-consumed configs as JSON (valid YAML)")
 
     args = parser.parse_args()
 
@@ -1321,7 +1694,8 @@ def main():
         setup_dir=args.config,
         dry_run=args.dry_run,
         skip_code_instrumentation=args.skip_code,
-        skip_ci_integration=args.skip_ci
+        skip_ci_integration=args.skip_ci,
+        json_output=args.json_output
     )
 
     agent = RLCConstructionAgent(config)
@@ -11,14 +11,52 @@ This module handles ingestion of events from multiple sources:
 Events are normalized and routed to the event handler for processing.
 """
 
+import os
 import json
+import sys
+import inspect
 import hashlib
 import asyncio
+import logging
+import itertools
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# slots=True needs Python 3.10; older interpreters keep __dict__-backed instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ISO-8601 timestamp parsing: ciso8601 when installed; fromisoformat accepts
+# a trailing "Z" natively from Python 3.11
+try:
+    from ciso8601 import parse_datetime as _parse_ts
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_ts = datetime.fromisoformat
+    else:
+        def _parse_ts(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# BLAKE2b-48 produces the 12 hex chars directly; SHA-256 prefixes stay the
+# default so existing IDs remain comparable. Enable with RLC_BLAKE2_IDS=1.
+USE_BLAKE2_IDS = os.environ.get("RLC_BLAKE2_IDS") == "1"
+
+
+def _canonical_json(data: Any) -> bytes:
+    """Compact, key-sorted JSON bytes for hashing"""
+    # Always stdlib json: orjson formats floats differently (1e16 vs 1e+16), which
+    # would make IDs depend on whether orjson is installed
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
 
 class EventType(Enum):
     """Standard event types in the RLC framework"""
@@ -56,7 +94,34 @@ class EventSource(Enum):
     MANUAL = "manual"
 
 
-@dataclass
+# Intern enum values so value-keyed dict/set lookups downstream (routing
+# indexes, severity conditions) hit on identity before comparing strings
+for _enum in (EventType, EventSeverity, EventSource):
+    for _member in _enum:
+        _member._value_ = sys.intern(_member._value_)
+del _enum, _member
+
+# Value -> member lookups; cheaper than Enum.__call__ on the ingest path
+_EVENT_TYPE_BY_VALUE = {m.value: m for m in EventType}
+_SEVERITY_BY_VALUE = {m.value: m for m in EventSeverity}
+_SOURCE_BY_VALUE = {m.value: m for m in EventSource}
+
+# Prometheus "severity" label -> event severity (firing alerts)
+_PROM_SEVERITY = {
+    "critical": EventSeverity.CRITICAL,
+    "warning": EventSeverity.HIGH,
+    "info": EventSeverity.INFO
+}
+
+# CloudWatch alarm state -> event severity
+_CW_STATE_SEVERITY = {
+    "ALARM": EventSeverity.CRITICAL,
+    "INSUFFICIENT_DATA": EventSeverity.MEDIUM,
+    "OK": EventSeverity.INFO
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Event:
     """
     Normalized event structure for the RLC framework.
@@ -78,20 +143,46 @@ class Event:
     processing_attempts: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert event to dictionary, handling enums and datetime"""
-        data = asdict(self)
-        data['event_type'] = self.event_type.value
-        data['severity'] = self.severity.value
-        data['source'] = self.source.value
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        """
+        Convert event to dictionary, handling enums and datetime.
+
+        The copy is shallow: metadata and source_data are shared with the
+        event, so callers must not mutate those nested containers.
+        """
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type.value,
+            "severity": self.severity.value,
+            "source": self.source.value,
+            "timestamp": self.timestamp.isoformat(),
+            "title": self.title,
+            "description": self.description,
+            "metadata": self.metadata,
+            "source_data": self.source_data,
+            "correlation_id": self.correlation_id,
+            "incident_id": self.incident_id,
+            "processed": self.processed,
+            "processing_attempts": self.processing_attempts
+        }
+
+    def to_json(self, indent: bool = False) -> bytes:
+        """Serialize event to JSON bytes; orjson encodes the dataclass directly when available"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            try:
+                return orjson.dumps(self, option=option)
+            except TypeError:
+                pass
+        # Raw UTF-8 like orjson, so output doesn't depend on which encoder is installed
+        return json.dumps(self.to_dict(), indent=2 if indent else None, ensure_ascii=False).encode()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
         """Create event from dictionary"""
-        data['event_type'] = EventType(data['event_type'])
-        data['severity'] = EventSeverity(data['severity'])
-        data['source'] = EventSource(data['source'])
+        # Unknown values still raise ValueError via the Enum constructor
+        data['event_type'] = _EVENT_TYPE_BY_VALUE.get(data['event_type']) or EventType(data['event_type'])
+        data['severity'] = _SEVERITY_BY_VALUE.get(data['severity']) or EventSeverity(data['severity'])
+        data['source'] = _SOURCE_BY_VALUE.get(data['source']) or EventSource(data['source'])
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         return cls(**data)
 
@@ -101,14 +192,33 @@ def generate_event_id(event_data: Dict[str, Any]) -> str:
     Generate a deterministic event ID from event data.
 
     Format: EVT-YYYYMMDD-<hash>
+
+    The payload is serialized straight to bytes and hashed with OpenSSL's
+    SHA-256, which is hardware accelerated where the CPU supports it, or
+    with a 6-byte BLAKE2b digest when USE_BLAKE2_IDS is set.
     """
     date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
     # Hash of key event fields for uniqueness
-    hash_input = json.dumps(event_data, sort_keys=True)
-    hash_hex = hashlib.sha256(hash_input.encode()).hexdigest()[:12]
+    payload = _canonical_json(event_data)
+    if USE_BLAKE2_IDS:
+        hash_hex = hashlib.blake2b(payload, digest_size=6).hexdigest()
+    else:
+        hash_hex = hashlib.sha256(payload).hexdigest()[:12]
     return f"EVT-{date_str}-{hash_hex}"
 
 
+def _is_async_handler(handler) -> bool:
+    """True for coroutine functions, partials of them, and objects with an async __call__"""
+    return (inspect.iscoroutinefunction(handler)
+            or inspect.iscoroutinefunction(getattr(handler, "__call__", None)))
+
+
+def _log_handler_errors(event_id: str, errors: List[BaseException]):
+    """Log exceptions raised by event handlers"""
+    for error in errors:
+        logger.error("Handler error for %s: %s", event_id, error, exc_info=error)
+
+
 class EventIngester:
     """
     Main event ingestion class.
@@ -118,13 +228,29 @@ class EventIngester:
     """
 
     def __init__(self):
-        self.event_handlers = []
-        self.event_buffer = []
-        self.buffer_size = 1000
+        # Handlers split by kind at registration; add them via register_handler
+        self._sync_handlers = []
+        self._async_handlers = []
+        # Bounded: appending past buffer_size evicts the oldest event in O(1)
+        self.event_buffer = deque(maxlen=1000)
+
+    @property
+    def buffer_size(self) -> int:
+        """Maximum number of events kept in event_buffer"""
+        return self.event_buffer.maxlen
+
+    @buffer_size.setter
+    def buffer_size(self, size: int):
+        # A deque's maxlen is fixed; rebuild it, keeping the newest events
+        self.event_buffer = deque(self.event_buffer, maxlen=size)
 
     def register_handler(self, handler):
         """Register an event handler callback"""
-        self.event_handlers.append(handler)
+        # Classified once here so _process_event never inspects handlers
+        if _is_async_handler(handler):
+            self._async_handlers.append(handler)
+        else:
+            self._sync_handlers.append(handler)
 
     async def ingest_webhook(self, data: Dict[str, Any]) -> Event:
         """
@@ -142,8 +268,9 @@ class EventIngester:
         event_id = generate_event_id(data)
         event = Event(
             event_id=event_id,
-            event_type=EventType(data.get("type", "custom")),
-            severity=EventSeverity(data.get("severity", "medium")),
+            # Missing or unknown values fall back to safe defaults instead of raising
+            event_type=_EVENT_TYPE_BY_VALUE.get(data.get("type"), EventType.MANUAL_REPORT),
+            severity=_SEVERITY_BY_VALUE.get(data.get("severity"), EventSeverity.MEDIUM),
             source=EventSource.WEBHOOK,
             timestamp=datetime.now(timezone.utc),
             title=data.get("title", "Untitled Event"),
@@ -153,9 +280,9 @@ class EventIngester:
         )
         return await self._process_event(event)
 
-    async def ingest_prometheus_alert(self, alert: Dict[str, Any]) -> Event:
+    async def ingest_prometheus_alert(self, alert: Dict[str, Any]) -> List[Event]:
         """
-        Ingest event from Prometheus alert.
+        Ingest events from a Prometheus alert webhook, one per alert.
 
         Prometheus webhook format:
         {
@@ -171,50 +298,46 @@ class EventIngester:
             ...
         }
         """
-        # Process first alert for simplicity (can process multiple)
-        alert_data = alert.get("alerts", [{}])[0]
-
-        # Determine event type from labels
-        alert_name = alert_data.get("labels", {}).get("alertname", "")
-        if "anomaly" in alert_name.lower():
-            event_type = EventType.METRIC_ANOMALY
-        elif "threshold" in alert_name.lower():
-            event_type = EventType.METRIC_THRESHOLD
-        else:
-            event_type = EventType.METRIC_THRESHOLD  # Default
-
-        # Map Prometheus status to severity
-        status = alert_data.get("status", "firing")
-        if status == "firing":
-            # Use labels to determine severity
-            severity_label = alert_data.get("labels", {}).get("severity", "warning")
-            severity_map = {
-                "critical": EventSeverity.CRITICAL,
-                "warning": EventSeverity.HIGH,
-                "info": EventSeverity.INFO
-            }
-            severity = severity_map.get(severity_label, EventSeverity.MEDIUM)
-        else:
-            severity = EventSeverity.INFO
-
-        event = Event(
-            event_id=generate_event_id(alert_data),
-            event_type=event_type,
-            severity=severity,
-            source=EventSource.PROMETHEUS,
-            timestamp=datetime.fromisoformat(
-                alert_data.get("startsAt", datetime.now(timezone.utc).isoformat())
-                .replace('Z', '+00:00')
-            ),
-            title=alert_data.get("annotations", {}).get("summary", alert_name),
-            description=alert_data.get("annotations", {}).get("description", ""),
-            metadata={
-                "labels": alert_data.get("labels", {}),
-                "value": alert_data.get("annotations", {}).get("value", "")
-            },
-            source_data=alert
-        )
-        return await self._process_event(event)
+        events = []
+        for alert_data in alert.get("alerts") or ():
+            labels = alert_data.get("labels") or {}
+            annotations = alert_data.get("annotations") or {}
+
+            # Determine event type from labels
+            alert_name = labels.get("alertname", "")
+            if "anomaly" in alert_name.lower():
+                event_type = EventType.METRIC_ANOMALY
+            elif "threshold" in alert_name.lower():
+                event_type = EventType.METRIC_THRESHOLD
+            else:
+                event_type = EventType.METRIC_THRESHOLD  # Default
+
+            # Map Prometheus status to severity
+            status = alert_data.get("status", "firing")
+            if status == "firing":
+                # Use labels to determine severity
+                severity_label = labels.get("severity", "warning")
+                severity = _PROM_SEVERITY.get(severity_label, EventSeverity.MEDIUM)
+            else:
+                severity = EventSeverity.INFO
+
+            starts_at = alert_data.get("startsAt")
+            events.append(Event(
+                event_id=generate_event_id(alert_data),
+                event_type=event_type,
+                severity=severity,
+                source=EventSource.PROMETHEUS,
+                timestamp=_parse_ts(starts_at) if starts_at else datetime.now(timezone.utc),
+                title=annotations.get("summary", alert_name),
+                description=annotations.get("description", ""),
+                metadata={
+                    "labels": labels,
+                    "value": annotations.get("value", "")
+                },
+                source_data=alert
+            ))
+
+        return list(await asyncio.gather(*(self._process_event(event) for event in events)))
 
     async def ingest_cloudwatch_alarm(self, alarm: Dict[str, Any]) -> Event:
         """
@@ -227,12 +350,7 @@ class EventIngester:
         reason = alarm.get("NewStateReason", "")
 
         # Map alarm state to severity
-        state_to_severity = {
-            "ALARM": EventSeverity.CRITICAL,
-            "INSUFFICIENT_DATA": EventSeverity.MEDIUM,
-            "OK": EventSeverity.INFO
-        }
-        severity = state_to_severity.get(new_state, EventSeverity.LOW)
+        severity = _CW_STATE_SEVERITY.get(new_state, EventSeverity.LOW)
 
         # Determine event type
         metric_name = alarm.get("Trigger", {}).get("MetricName", "")
@@ -287,18 +405,33 @@ class EventIngester:
         """
         # Add to buffer for persistence/analysis
         self.event_buffer.append(event)
-        if len(self.event_buffer) > self.buffer_size:
-            self.event_buffer.pop(0)
 
-        # Call registered handlers
-        for handler in self.event_handlers:
+        # Call registered handlers; async handlers run concurrently
+        errors = []
+        cancelled = None
+        for handler in self._sync_handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event)
-                else:
-                    handler(event)
+                handler(event)
             except Exception as e:
-                print(f"Handler error: {e}")
+                errors.append(e)
+
+        if self._async_handlers:
+            results = await asyncio.gather(
+                *(handler(event) for handler in self._async_handlers),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, asyncio.CancelledError):
+                    cancelled = cancelled or result
+                elif isinstance(result, BaseException):
+                    errors.append(result)
+
+        # Report failures after the event is handled rather than inline
+        if errors:
+            asyncio.get_running_loop().call_soon(_log_handler_errors, event.event_id, errors)
+        # A cancelled handler cancels the ingest, as when handlers were awaited in turn
+        if cancelled is not None:
+            raise cancelled
 
         event.processed = True
         return event
@@ -306,8 +439,9 @@ class EventIngester:
     def get_buffered_events(self, limit: Optional[int] = None) -> List[Event]:
         """Get buffered events, optionally limited"""
         if limit:
-            return self.event_buffer[-limit:]
-        return self.event_buffer.copy()
+            start = max(0, len(self.event_buffer) - limit)
+            return list(itertools.islice(self.event_buffer, start, None))
+        return list(self.event_buffer)
 
 
 # CLI interface for manual event ingestion
@@ -337,7 +471,8 @@ def main():
 
     event = asyncio.run(ingester.ingest_manual_report(event_data))
     print(f"Event ingested: {event.event_id}")
-    print(json.dumps(event.to_dict(), indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(event.to_json(indent=True) + b"\n")
 
 
 if __name__ == "__main__":
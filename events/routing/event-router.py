@@ -12,13 +12,159 @@ Supports both synchronous (immediate) and asynchronous (queued) routing.
 """
 
 import re
-import json
-from typing import Dict, Any, List, Callable, Optional
-from dataclasses import dataclass
+import sys
+import logging
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Callable, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from event_ingester import Event, EventType, EventSeverity
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+# slots=True needs Python 3.10; older interpreters keep __dict__-backed instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Below this many rules, short-circuiting per-rule re searches beats a full
+# Hyperscan scan of every pattern
+_HYPERSCAN_MIN_RULES = 50
+
+
+def _insort_rule(rules: list, rule) -> None:
+    """Insert rule after every rule of equal or higher priority (bisect's key= needs 3.10)"""
+    lo, hi = 0, len(rules)
+    priority = rule.priority
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if rules[mid].priority < priority:
+            hi = mid
+        else:
+            lo = mid + 1
+    rules.insert(lo, rule)
+
+
+# Characters with special meaning in a regex, and the quantifiers among them
+_REGEX_META = frozenset(".^$*+?{}[]()|\\")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def _literal_prefixes(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Literal text each top-level alternative of pattern must start with.
+
+    Returns None when any alternative has no literal prefix (or the pattern
+    uses groups/classes before one), meaning the pattern can't be prefiltered.
+    """
+    prefixes = []
+    current = []
+    literal = True  # still collecting the current alternative's prefix
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            nxt = pattern[i + 1:i + 2]
+            if literal and depth == 0 and nxt and not nxt.isalnum():
+                current.append(nxt)
+            else:
+                literal = False
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            literal = False
+        elif ch == "(":
+            depth += 1
+            literal = False
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            prefixes.append("".join(current))
+            current = []
+            literal = True
+        elif literal and depth == 0:
+            if ch in _REGEX_QUANTIFIERS:
+                # The previous character may repeat zero times
+                if current:
+                    current.pop()
+                literal = False
+            elif ch in _REGEX_META:
+                literal = False
+            else:
+                current.append(ch)
+        i += 1
+    prefixes.append("".join(current))
+    if not all(prefixes):
+        return None
+    return tuple(prefixes)
+
+
+# Stands in for a missing metadata key; compares unequal to any condition value
+_MISSING = object()
+
+
+def _no_conditions(sev_val: str, metadata: Dict[str, Any]) -> bool:
+    """Predicate for rules without severity or metadata conditions"""
+    return True
+
+
+def _compile_conditions(severity_set: Optional[frozenset], conditions: Dict[str, Any]) -> Callable:
+    """Build a (sev_val, metadata) predicate with each condition's kind decided up front"""
+    equal_checks = []
+    member_checks = []
+    for key, value in conditions.items():
+        if key == "severity":
+            continue
+        if isinstance(value, list):
+            try:
+                member_checks.append((key, frozenset(value), value))
+            except TypeError:
+                # Unhashable entries keep the linear list scan
+                member_checks.append((key, None, value))
+        else:
+            equal_checks.append((key, value))
+    equal_checks = tuple(equal_checks)
+    member_checks = tuple(member_checks)
+
+    if not equal_checks and not member_checks:
+        if severity_set is None:
+            return _no_conditions
+        return lambda sev_val, metadata: sev_val in severity_set
+
+    def predicate(sev_val: str, metadata: Dict[str, Any]) -> bool:
+        if severity_set is not None and sev_val not in severity_set:
+            return False
+        for key, value in equal_checks:
+            if metadata.get(key, _MISSING) != value:
+                return False
+        for key, value_set, values in member_checks:
+            if key not in metadata:
+                return False
+            actual = metadata[key]
+            if value_set is not None:
+                try:
+                    if actual not in value_set:
+                        return False
+                    continue
+                except TypeError:
+                    # Unhashable metadata value; fall back to the list
+                    pass
+            if actual not in values:
+                return False
+        return True
+
+    return predicate
+
 
 class RoutingStrategy(Enum):
     """How to route events to agents"""
@@ -28,7 +174,7 @@ class RoutingStrategy(Enum):
     PARALLEL = "parallel"  # Send to multiple agents concurrently
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RoutingRule:
     """
     A routing rule determines which agents handle which events.
@@ -42,36 +188,70 @@ class RoutingRule:
     strategy: RoutingStrategy
     conditions: Dict[str, Any]  # Additional conditions (severity, metadata)
     timeout_seconds: int = 300  # How long to wait for agent response
+    _type_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _title_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _severity_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _predicate: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+    _literals: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _literals_lower: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.compile()
+
+    def compile(self):
+        """Precompile the rule pattern (event type is case-sensitive, title is not) and conditions"""
+        self._type_re = re.compile(self.pattern)
+        self._title_re = re.compile(self.pattern, re.IGNORECASE)
+        self._literals = _literal_prefixes(self.pattern)
+        self._literals_lower = None
+        if self._literals is not None and all(lit.isascii() for lit in self._literals):
+            self._literals_lower = tuple(lit.lower() for lit in self._literals)
+        required_severity = self.conditions.get("severity", _MISSING)
+        if required_severity is _MISSING:
+            self._severity_set = None
+        else:
+            if not isinstance(required_severity, (list, tuple, set, frozenset)):
+                required_severity = (required_severity,)
+            # Interned to match EventSeverity values by identity
+            self._severity_set = frozenset(
+                sys.intern(sev) if type(sev) is str else sev for sev in required_severity
+            )
+        self._predicate = _compile_conditions(self._severity_set, self.conditions)
 
     def matches(self, event: Event) -> bool:
         """Check if this rule matches the event"""
-        # Check pattern match
-        if not re.search(self.pattern, event.event_type.value) and \
-           not re.search(self.pattern, event.title, re.IGNORECASE):
+        return self.matches_fast(event.event_type.value, event.title,
+                                 event.severity.value, event.metadata)
+
+    def matches_fast(self, type_val: str, title: str, sev_val: str, metadata: Dict[str, Any],
+                     title_lower: Optional[str] = None) -> bool:
+        """
+        Check if this rule matches an event given its pre-extracted fields.
+
+        title_lower is title.lower() for ASCII titles, used for the literal prefilter.
+        """
+        # Cheap scalar conditions first so most rules reject without a regex search
+        if not self._predicate(sev_val, metadata):
             return False
 
-        # Check severity condition
-        if "severity" in self.conditions:
-            required_severity = self.conditions["severity"]
-            if isinstance(required_severity, list):
-                if event.severity.value not in required_severity:
-                    return False
-            elif event.severity.value != required_severity:
+        # Literal prefilter: every match starts with one of the pattern's literal
+        # prefixes, so if none occurs in either field the regexes can't match.
+        # Titles are only prefiltered when ASCII, where lower() agrees with IGNORECASE.
+        literals_lower = self._literals_lower
+        if literals_lower is not None:
+            if title_lower is None and title.isascii():
+                title_lower = title.lower()
+            if title_lower is not None and \
+               not any(lit in title_lower for lit in literals_lower) and \
+               not any(lit in type_val for lit in self._literals):
                 return False
 
-        # Check metadata conditions
-        for key, value in self.conditions.items():
-            if key == "severity":
-                continue
-            if key not in event.metadata:
-                return False
-            if isinstance(value, list):
-                if event.metadata[key] not in value:
-                    return False
-            elif event.metadata[key] != value:
-                return False
+        # Check pattern match
+        return bool(self._type_re.search(type_val) or self._title_re.search(title))
 
-        return True
+    def conditions_match_fast(self, sev_val: str, metadata: Dict[str, Any]) -> bool:
+        """Check the severity and metadata conditions, ignoring the pattern"""
+        return self._predicate(sev_val, metadata)
 
 
 class EventRouter:
@@ -82,21 +262,78 @@ class EventRouter:
     """
 
     def __init__(self):
-        self.rules: List[RoutingRule] = []
+        # Priority-sorted rules; add them via add_rule so the severity index stays in step
+        self._rules: List[RoutingRule] = []
         self.agent_registry: Dict[str, Callable] = {}
-        self.routing_history: List[Dict[str, Any]] = []
+        # Rule agent name -> agents it expands to for BROADCAST/SEQUENTIAL/PARALLEL;
+        # names without a group route to themselves
+        self.agent_groups: Dict[str, Tuple[str, ...]] = {}
+        self.history_size = 10000
+        self.routing_history: deque = deque(maxlen=self.history_size)
+        # Agent hit counts over the records currently in routing_history
+        self._agent_counter: Counter = Counter()
         self.default_agent = "event-classifier"
+        # Priority-ordered candidate rules per severity value; rules without a
+        # severity condition appear in every bucket and in _rules_any_severity
+        self._rules_by_severity: Dict[str, List[RoutingRule]] = {}
+        self._rules_any_severity: List[RoutingRule] = []
+        # Optional Hyperscan databases over all rule patterns, rebuilt lazily
+        self._hs_dbs = None
+        self._hs_dirty = True
+        # Fan-out pool for BROADCAST/PARALLEL rules; created on first fan-out and
+        # released by close()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "EventRouter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the fan-out pool without waiting; queued dispatches are cancelled"""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if sys.version_info >= (3, 9):
+            pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            pool.shutdown(wait=False)
+
+    @property
+    def rules(self) -> Tuple[RoutingRule, ...]:
+        """Routing rules, highest priority first (read-only; use add_rule)"""
+        return tuple(self._rules)
 
     def add_rule(self, rule: RoutingRule):
         """Add a routing rule"""
-        self.rules.append(rule)
-        # Sort by priority (highest first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        rule.compile()
+        # Keep sorted by priority (highest first); equal priorities stay in insertion order
+        _insort_rule(self._rules, rule)
+        self._index_rule(rule)
+        self._hs_dirty = True
+
+    def _index_rule(self, rule: RoutingRule):
+        """Insert a rule into the per-severity rule index"""
+        if rule._severity_set is None:
+            _insort_rule(self._rules_any_severity, rule)
+            for bucket in self._rules_by_severity.values():
+                _insort_rule(bucket, rule)
+            return
+        for sev in rule._severity_set:
+            bucket = self._rules_by_severity.get(sev)
+            if bucket is None:
+                bucket = self._rules_by_severity[sev] = list(self._rules_any_severity)
+            _insort_rule(bucket, rule)
 
     def register_agent(self, name: str, handler: Callable):
         """Register an agent handler"""
         self.agent_registry[name] = handler
 
+    def register_agent_group(self, name: str, agents: Sequence[str]):
+        """Register a group (team, fallback chain) that a rule's agent name expands to"""
+        self.agent_groups[name] = tuple(agents)
+
     def route(self, event: Event) -> List[str]:
         """
         Route an event to appropriate agents.
@@ -105,30 +342,27 @@ class EventRouter:
         """
         routed_agents = []
 
-        # Find matching rules
-        matching_rules = [rule for rule in self.rules if rule.matches(event)]
+        # Only the highest priority matching rule is used, so stop at the first
+        rule = self._first_matching_rule(event)
 
-        if not matching_rules:
+        if rule is None:
             # Route to default agent
             agent = self.default_agent
             self._dispatch_to_agent(event, agent)
             routed_agents.append(agent)
         else:
-            # Use highest priority matching rule
-            rule = matching_rules[0]
-
             if rule.strategy == RoutingStrategy.SINGLE:
                 self._dispatch_to_agent(event, rule.agent)
                 routed_agents.append(rule.agent)
 
             elif rule.strategy == RoutingStrategy.BROADCAST:
-                for agent in self._get_agents_for_broadcast(rule.agent):
-                    self._dispatch_to_agent(event, agent)
-                    routed_agents.append(agent)
+                agents = self.agent_groups.get(rule.agent) or (rule.agent,)
+                self._dispatch_concurrently(event, agents, rule.timeout_seconds)
+                routed_agents.extend(agents)
 
             elif rule.strategy == RoutingStrategy.SEQUENTIAL:
                 accepted = False
-                for agent in self._get_agents_for_sequential(rule.agent):
+                for agent in self.agent_groups.get(rule.agent) or (rule.agent,):
                     if self._dispatch_to_agent(event, agent):
                         routed_agents.append(agent)
                         accepted = True
@@ -139,51 +373,123 @@ class EventRouter:
                     routed_agents.append(self.default_agent)
 
             elif rule.strategy == RoutingStrategy.PARALLEL:
-                for agent in self._get_agents_for_parallel(rule.agent):
-                    self._dispatch_to_agent(event, agent)
-                    routed_agents.append(agent)
+                agents = self.agent_groups.get(rule.agent) or (rule.agent,)
+                self._dispatch_concurrently(event, agents, rule.timeout_seconds)
+                routed_agents.extend(agents)
 
         # Record routing decision
-        self._record_routing(event, routed_agents, matching_rules)
+        self._record_routing(event, routed_agents, rule)
 
         return routed_agents
 
+    def _first_matching_rule(self, event: Event) -> Optional[RoutingRule]:
+        """Return the highest priority rule matching the event, if any"""
+        tv, ti, sv, md = event.event_type.value, event.title, event.severity.value, event.metadata
+        candidates = self._rules_by_severity.get(sv)
+        if candidates is None:
+            candidates = self._rules_any_severity
+
+        hits = self._scan_patterns(tv, ti) if hyperscan is not None else None
+        if hits is not None:
+            for rule in candidates:
+                if id(rule) in hits and rule.conditions_match_fast(sv, md):
+                    return rule
+            return None
+
+        tl = ti.lower() if ti.isascii() else None
+        for rule in candidates:
+            if rule.matches_fast(tv, ti, sv, md, tl):
+                return rule
+        return None
+
+    def _build_hyperscan(self):
+        """Compile every rule pattern into Hyperscan databases for the type and title fields"""
+        self._hs_dirty = False
+        self._hs_dbs = None
+        if len(self._rules) < _HYPERSCAN_MIN_RULES:
+            return
+
+        expressions = [rule.pattern.encode() for rule in self._rules]
+        count = len(expressions)
+        base = (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY |
+                hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        dbs = []
+        # Event types match case-sensitively and titles case-insensitively, as in RoutingRule
+        for flags in (base, base | hyperscan.HS_FLAG_CASELESS):
+            db = hyperscan.Database()
+            try:
+                db.compile(expressions=expressions, ids=list(range(count)),
+                           elements=count, flags=[flags] * count)
+            except hyperscan.error as e:
+                # Patterns outside Hyperscan's dialect (e.g. backreferences) stay on re
+                logger.info("Hyperscan unavailable for routing rules: %s", e)
+                return
+            dbs.append(db)
+        self._hs_dbs = (list(self._rules), dbs[0], dbs[1])
+
+    def _scan_patterns(self, type_val: str, title: str) -> Optional[set]:
+        """Return ids of rules whose pattern matches, or None when Hyperscan isn't in use"""
+        if self._hs_dirty:
+            self._build_hyperscan()
+        if self._hs_dbs is None:
+            return None
+
+        rules, type_db, title_db = self._hs_dbs
+        hits = set()
+
+        def on_match(rule_index, start, end, flags, context):
+            hits.add(id(rules[rule_index]))
+
+        type_db.scan(type_val.encode(), match_event_handler=on_match)
+        title_db.scan(title.encode(), match_event_handler=on_match)
+        return hits
+
     def _dispatch_to_agent(self, event: Event, agent_name: str) -> bool:
         """Dispatch event to a specific agent"""
         if agent_name not in self.agent_registry:
-            print(f"Warning: Agent {agent_name} not registered")
+            logger.warning("Agent %s not registered", agent_name)
             return False
 
         try:
             handler = self.agent_registry[agent_name]
             handler(event)
             return True
-        except Exception as e:
-            print(f"Error dispatching to {agent_name}: {e}")
+        except Exception:
+            logger.exception("Error dispatching to %s", agent_name)
             return False
 
-    def _get_agents_for_broadcast(self, base_agent: str) -> List[str]:
-        """Get list of agents for broadcast routing"""
-        # Could be expanded to support agent groups
-        return [base_agent]
-
-    def _get_agents_for_sequential(self, base_agent: str) -> List[str]:
-        """Get ordered list of agents for sequential routing"""
-        # Could be expanded to support fallback chains
-        return [base_agent]
-
-    def _get_agents_for_parallel(self, base_agent: str) -> List[str]:
-        """Get list of agents for parallel routing"""
-        # Could be expanded to support agent teams
-        return [base_agent]
-
-    def _record_routing(self, event: Event, agents: List[str], rules: List[RoutingRule]):
+    def _dispatch_concurrently(self, event: Event, agents: Sequence[str], timeout: float):
+        """Dispatch event to several agents on the pool, waiting up to timeout seconds"""
+        if len(agents) == 1:
+            # Nothing to overlap; skip the thread hop
+            self._dispatch_to_agent(event, agents[0])
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="event-router")
+        futures = [self._pool.submit(self._dispatch_to_agent, event, agent) for agent in agents]
+        _, pending = wait(futures, timeout=timeout)
+        if pending:
+            # Handlers can't be interrupted; ones already running keep their pool
+            # thread, which the interpreter joins at exit
+            logger.warning("%d of %d agents still running for event %s after %ss",
+                           len(pending), len(agents), event.event_id, timeout)
+
+    def _record_routing(self, event: Event, agents: List[str], rule: Optional[RoutingRule]):
         """Record routing decision for analysis"""
-        self.routing_history.append({
+        history = self.routing_history
+        if len(history) == history.maxlen:
+            # The oldest record is about to be evicted; drop it from the counts
+            counter = self._agent_counter
+            for agent in history[0]["routed_to"]:
+                counter[agent] -= 1
+                if not counter[agent]:
+                    del counter[agent]
+        self._agent_counter.update(agents)
+        history.append({
             "event_id": event.event_id,
             "event_type": event.event_type.value,
             "routed_to": agents,
-            "matching_rule": rules[0].name if rules else "default",
+            "matching_rule": rule.name if rule is not None else "default",
             "timestamp": event.timestamp.isoformat()
         })
 
@@ -192,15 +498,11 @@ class EventRouter:
         if not self.routing_history:
             return {}
 
-        agent_counts = {}
-        for record in self.routing_history:
-            for agent in record["routed_to"]:
-                agent_counts[agent] = agent_counts.get(agent, 0) + 1
-
+        agent_counts = self._agent_counter
         return {
             "total_routed": len(self.routing_history),
-            "agent_distribution": agent_counts,
-            "most_common": max(agent_counts.items(), key=lambda x: x[1]) if agent_counts else None
+            "agent_distribution": dict(agent_counts),
+            "most_common": agent_counts.most_common(1)[0] if agent_counts else None
         }
 
 
@@ -363,7 +665,8 @@ def main():
     )
 
     # Route event
-    routed = router.route(event)
+    with router:
+        routed = router.route(event)
     print(f"Event routed to: {', '.join(routed)}")
 
 
@@ -6,12 +6,15 @@ This module implements the state machine for incident lifecycle management.
 States follow the RLC gates: detecting → triaging → responding → recovering → resolved → post_mortem → closed
 """
 
-import json
-from typing import Dict, Any, List, Optional, Callable
+import sys
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
 
+# slots=True needs Python 3.10; older interpreters keep __dict__-backed instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class IncidentState(Enum):
     """Incident lifecycle states"""
@@ -33,12 +36,19 @@ class IncidentSeverity(Enum):
     SEV4 = "SEV4"  # Cosmetic issues
 
 
+# Intern enum values so lookups keyed on .value hit on identity
+for _enum in (IncidentState, IncidentSeverity):
+    for _member in _enum:
+        _member._value_ = sys.intern(_member._value_)
+del _enum, _member
+
+
 class StateTransitionError(Exception):
     """Raised when invalid state transition is attempted"""
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IncidentTransition:
     """Record of a state transition"""
     from_state: IncidentState
@@ -49,7 +59,18 @@ class IncidentTransition:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+def _serialize_transition(t: IncidentTransition, timestamp: str) -> Dict[str, Any]:
+    """Dictionary form of a transition as used by Incident.to_dict"""
+    return {
+        "from": t.from_state.value,
+        "to": t.to_state.value,
+        "timestamp": timestamp,
+        "reason": t.reason,
+        "actor": t.actor
+    }
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Incident:
     """
     Incident representation with state machine.
@@ -74,8 +95,27 @@ class Incident:
     response_gate_complete: bool = False
     resolution_gate_complete: bool = False
 
+    # (transition, timestamp, timestamp.isoformat()) per transition, so to_dict
+    # formats each timestamp once; entries are checked by identity before reuse
+    _timestamps_serialized: List[Tuple[IncidentTransition, datetime, str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert incident to dictionary"""
+        cache = self._timestamps_serialized
+        transitions = []
+        for i, t in enumerate(self.transitions):
+            if i < len(cache) and cache[i][0] is t and cache[i][1] is t.timestamp:
+                iso = cache[i][2]
+            else:
+                iso = t.timestamp.isoformat()
+                if i < len(cache):
+                    cache[i] = (t, t.timestamp, iso)
+                else:
+                    cache.append((t, t.timestamp, iso))
+            transitions.append(_serialize_transition(t, iso))
+        del cache[len(self.transitions):]
         return {
             "incident_id": self.incident_id,
             "title": self.title,
@@ -86,16 +126,7 @@ class Incident:
             "updated_at": self.updated_at.isoformat(),
             "affected_services": self.affected_services,
             "assigned_to": self.assigned_to,
-            "transitions": [
-                {
-                    "from": t.from_state.value,
-                    "to": t.to_state.value,
-                    "timestamp": t.timestamp.isoformat(),
-                    "reason": t.reason,
-                    "actor": t.actor
-                }
-                for t in self.transitions
-            ],
+            "transitions": transitions,
             "metadata": self.metadata,
             "gates": {
                 "detection": self.detection_gate_complete,
@@ -114,14 +145,14 @@ class IncidentStateMachine:
     """
 
     # Valid state transitions
-    VALID_TRANSITIONS = {
-        IncidentState.DETECTING: [IncidentState.TRIAGING, IncidentState.CLOSED],
-        IncidentState.TRIAGING: [IncidentState.RESPONDING, IncidentState.CLOSED],
-        IncidentState.RESPONDING: [IncidentState.RECOVERING, IncidentState.CLOSED],
-        IncidentState.RECOVERING: [IncidentState.RESOLVED, IncidentState.RESPONDING],
-        IncidentState.RESOLVED: [IncidentState.POST_MORTEM],
-        IncidentState.POST_MORTEM: [IncidentState.CLOSED],
-        IncidentState.CLOSED: []  # Terminal state
+    VALID_TRANSITIONS: Dict[IncidentState, frozenset] = {
+        IncidentState.DETECTING: frozenset({IncidentState.TRIAGING, IncidentState.CLOSED}),
+        IncidentState.TRIAGING: frozenset({IncidentState.RESPONDING, IncidentState.CLOSED}),
+        IncidentState.RESPONDING: frozenset({IncidentState.RECOVERING, IncidentState.CLOSED}),
+        IncidentState.RECOVERING: frozenset({IncidentState.RESOLVED, IncidentState.RESPONDING}),
+        IncidentState.RESOLVED: frozenset({IncidentState.POST_MORTEM}),
+        IncidentState.POST_MORTEM: frozenset({IncidentState.CLOSED}),
+        IncidentState.CLOSED: frozenset()  # Terminal state
     }
 
     # Required gate completions for transitions
@@ -137,6 +168,18 @@ class IncidentStateMachine:
         self.state_callbacks: Dict[IncidentState, List[Callable]] = {
             state: [] for state in IncidentState
         }
+        # Incidents by current state (and not yet closed), kept in step with
+        # create_incident/transition_to; _order holds creation positions so
+        # queries return incidents in the same order as self.incidents
+        self._by_state: Dict[IncidentState, Dict[str, Incident]] = {
+            state: {} for state in IncidentState
+        }
+        self._active: Dict[str, Incident] = {}
+        self._order: Dict[str, int] = {}
+        # GATE_REQUIREMENTS as old_state -> new_state -> gate attribute
+        self._gate_req: Dict[IncidentState, Dict[IncidentState, str]] = {}
+        for (old_state, new_state), gate in self.GATE_REQUIREMENTS.items():
+            self._gate_req.setdefault(old_state, {})[new_state] = gate
 
     def register_callback(self, state: IncidentState, callback: Callable):
         """Register a callback to be called when entering a state"""
@@ -164,7 +207,12 @@ class IncidentStateMachine:
             affected_services=affected_services,
             metadata=metadata or {}
         )
+        previous = self.incidents.get(incident_id)
+        if previous is not None:
+            self._unindex(previous)
         self.incidents[incident_id] = incident
+        self._order.setdefault(incident_id, len(self._order))
+        self._index(incident)
 
         # Record initial transition
         self._add_transition(
@@ -200,20 +248,22 @@ class IncidentStateMachine:
         old_state = incident.state
 
         # Validate transition
-        if new_state not in self.VALID_TRANSITIONS.get(old_state, []):
+        if new_state not in self.VALID_TRANSITIONS.get(old_state, ()):
             raise StateTransitionError(
                 f"Invalid transition from {old_state.value} to {new_state.value}"
             )
 
         # Check gate requirements
-        gate_requirement = self.GATE_REQUIREMENTS.get((old_state, new_state))
+        gate_requirement = self._gate_req.get(old_state, {}).get(new_state)
         if gate_requirement and not getattr(incident, gate_requirement, False):
             raise StateTransitionError(
                 f"Cannot transition: {gate_requirement} must be completed"
             )
 
         # Perform transition
+        self._unindex(incident)
         incident.state = new_state
+        self._index(incident)
         incident.updated_at = datetime.now(timezone.utc)
 
         # Record transition
@@ -269,18 +319,35 @@ class IncidentStateMachine:
         """Get an incident by ID"""
         return self.incidents.get(incident_id)
 
+    def _index(self, incident: Incident):
+        """Add an incident to the state indexes"""
+        self._by_state[incident.state][incident.incident_id] = incident
+        if incident.state != IncidentState.CLOSED:
+            self._active[incident.incident_id] = incident
+
+    def _unindex(self, incident: Incident):
+        """Remove an incident from the state indexes"""
+        self._by_state[incident.state].pop(incident.incident_id, None)
+        self._active.pop(incident.incident_id, None)
+
+    def _in_creation_order(self, incidents: Dict[str, Incident]) -> List[Incident]:
+        """Return indexed incidents in creation order"""
+        order = self._order
+        return sorted(incidents.values(), key=lambda i: order[i.incident_id])
+
     def get_incidents_by_state(self, state: IncidentState) -> List[Incident]:
         """Get all incidents in a given state"""
-        return [i for i in self.incidents.values() if i.state == state]
+        return self._in_creation_order(self._by_state[state])
 
     def get_active_incidents(self) -> List[Incident]:
         """Get all active (not closed) incidents"""
-        return [i for i in self.incidents.values() if i.state != IncidentState.CLOSED]
+        return self._in_creation_order(self._active)
 
 
 # CLI interface
 def main():
     """CLI for incident state machine operations"""
+    import json
     import argparse
 
     parser = argparse.ArgumentParser(description="Incident state machine CLI")
@@ -10,15 +10,39 @@ This tool:
 5. Creates setup artifacts for the specific environment
 """
 
+import hashlib
 import os
+import pickle
 import re
-import json
-import yaml
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
+# orjson is optional; speeds up the provider catalog load and json_output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+    import json
+    return json.dumps(data, indent=2).encode() + b"\n"
+
+
+def _dump_yaml(data: Any) -> str:
+    """Render data as block-style YAML; PyYAML is only imported when artifacts are written"""
+    import yaml
+    # Prefer the libyaml C emitter; fall back to the pure-Python implementation
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False)
+
 
 class CloudProvider(Enum):
     # Major Cloud Providers
@@ -92,7 +116,11 @@ class Language(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# slots=True needs Python 3.10; older interpreters keep __dict__-backed instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RepositoryAnalysis:
     """Results of repository analysis"""
     path: str
@@ -107,9 +135,84 @@ class RepositoryAnalysis:
     has_terraform: bool
     has_wasm: bool = False
     all_files: List[str] = field(default_factory=list)
+    basenames: frozenset = frozenset()  # File names present anywhere in the repo
+    suffixes: frozenset = frozenset()  # Every ".ext"/".a.ext" suffix of those names
+
+
+# Byte table lowercasing A-Z only; every content check is an ASCII literal
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+def _dot_suffixes(name: str) -> List[str]:
+    """Every suffix of a file name starting at a dot ('a.eks.yaml' -> '.eks.yaml', '.yaml')"""
+    suffixes = []
+    i = name.find(".")
+    while i != -1:
+        suffixes.append(name[i:])
+        i = name.find(".", i + 1)
+    return suffixes
+
+
+def _split_indicators(indicators) -> tuple:
+    """Split indicators into (dot suffixes, other '*' suffixes, substring literals)"""
+    suffixes = [i.replace("*", "") for i in indicators if i.startswith("*")]
+    # Only ".ext" suffixes without a "/" can be answered from a name's dot-suffix set
+    dotted = frozenset(ext for ext in suffixes if ext.startswith(".") and "/" not in ext)
+    other = tuple(ext for ext in suffixes if ext not in dotted)
+    literals = frozenset(i for i in indicators if not i.startswith("*"))
+    return dotted, other, literals
 
 
 @dataclass
+class _FileIndex:
+    """One-pass index over a repository's relative file paths"""
+    files: List[str]
+    files_lower: List[str]
+    blob: str  # Paths joined by newlines, for substring indicators
+    blob_lower: str
+    basenames: frozenset
+    suffixes: frozenset
+    hits: Dict[str, bool] = field(default_factory=dict)  # Substring indicator -> present
+
+    @classmethod
+    def build(cls, files: List[str], indicators=()) -> '_FileIndex':
+        """Index files, resolving every known substring indicator up front"""
+        basenames = set()
+        suffixes = set()
+        for f in files:
+            name = f.rpartition("/")[2]
+            if name not in basenames:
+                basenames.add(name)
+                suffixes.update(_dot_suffixes(name))
+        blob = "\n".join(files)
+        # One C substring search per indicator; a single named-group alternation regex
+        # over the blob backtracks at every offset and is far slower on large repos
+        hits = {indicator: indicator in blob for indicator in indicators}
+        files_lower = [f.lower() for f in files]
+        return cls(files, files_lower, blob, "\n".join(files_lower),
+                   frozenset(basenames), frozenset(suffixes), hits)
+
+    def has_any_suffix(self, dotted: frozenset, other: tuple = ()) -> bool:
+        """Same as any(f.endswith(ext)) over both groups; dotted must be plain '.ext' suffixes"""
+        if not self.suffixes.isdisjoint(dotted):
+            return True
+        return bool(other) and any(f.endswith(other) for f in self.files)
+
+    def has_substring(self, indicator: str) -> bool:
+        """Whether indicator occurs in some path"""
+        hit = self.hits.get(indicator)
+        if hit is None:
+            # Indicators never contain a newline, so a hit lies within one path
+            hit = self.hits[indicator] = indicator in self.blob
+        return hit
+
+    def matches(self, split: tuple) -> bool:
+        """Whether any indicator of a _split_indicators() triple is present"""
+        dotted, other, literals = split
+        return self.has_any_suffix(dotted, other) or any(self.has_substring(i) for i in literals)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EventHandlingOption:
     """A single event handling option with cost and quality assessment"""
     name: str  # Budget, Balanced, or Premium
@@ -118,21 +221,21 @@ class EventHandlingOption:
     log_source: str
     trace_source: str
     alert_destination: str
-    ingestion_methods: List[str]
-    required_integrations: List[str]
-    setup_commands: List[str]
+    ingestion_methods: Tuple[str, ...]
+    required_integrations: Tuple[str, ...]
+    setup_commands: Tuple[str, ...]
     estimated_monthly_cost: str  # e.g., "<$50", "$50-200", "$200+"
     setup_complexity: str  # Low, Medium, High
-    pros: List[str]
-    cons: List[str]
-    best_for: List[str]  # Use cases this option is best for
+    pros: Tuple[str, ...]
+    cons: Tuple[str, ...]
+    best_for: Tuple[str, ...]  # Use cases this option is best for
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EventHandlingPrescription:
     """Prescribed event handling setup with multiple options"""
     primary: EventHandlingOption  # Recommended option
-    options: List[EventHandlingOption]  # All available options
+    options: Tuple[EventHandlingOption, ...]  # All available options (shared catalog tuple)
     selected_tier: str = "balanced"  # Default selection
     # Opinionated recommendation metadata
     recommendation_reasons: List[str] = field(default_factory=list)
@@ -141,16 +244,16 @@ class EventHandlingPrescription:
     maturity_level: str = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentTeamPrescription:
     """Prescribed agent team for the environment"""
-    core_agents: List[str]
-    observer_agents: List[str]
-    monitor_agents: List[str]
-    alerter_agents: List[str]
-    controller_agents: List[str]
-    responder_agents: List[str]
-    optional_agents: List[str]
+    core_agents: Tuple[str, ...]
+    observer_agents: Tuple[str, ...]
+    monitor_agents: Tuple[str, ...]
+    alerter_agents: Tuple[str, ...]
+    controller_agents: Tuple[str, ...]
+    responder_agents: Tuple[str, ...]
+    optional_agents: Tuple[str, ...]
     custom_config: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -816,310 +919,358 @@ class RepositoryAnalyzer:
         "opentelemetry": ["opentelemetry.py", "otel_", "tracing/"],
     }
 
+    # (provider, path substring, content regex) in detection order. Paths are matched
+    # lowercased; regexes run against lowercased file content, "" matches any content
+    # and None excludes the path from that provider's check
+    PROVIDER_INDICATORS = (
+        # AWS
+        (CloudProvider.AWS, "terraform", re.compile(r"aws_|hashicorp/aws")),
+        (CloudProvider.AWS, "serverless", re.compile(r"aws:|aws-iam")),
+        (CloudProvider.AWS, "template.yaml", re.compile(r"aws:aws:|AWS::")),
+        (CloudProvider.AWS, "Procfile", None),  # Exclude from AWS check
+
+        # GCP
+        (CloudProvider.GCP, "cloudbuild.yaml", re.compile("")),
+        (CloudProvider.GCP, "app.yaml", re.compile(r"runtime:")),  # Cloud Run app.yaml
+        (CloudProvider.GCP, "main.py", None),  # Exclude generic .py
+        (CloudProvider.GCP, "terraform", re.compile(r"google_compute")),
+
+        # Azure
+        (CloudProvider.AZURE, "azure-pipelines", re.compile("")),
+        (CloudProvider.AZURE, "main.bicep", re.compile("")),
+        (CloudProvider.AZURE, "terraform", re.compile(r"azurerm")),
+        (CloudProvider.AZURE, "template.yaml", re.compile(r"azure:")),
+
+        # European providers
+        (CloudProvider.SCALEWAY, "terraform", re.compile(r"scaleway")),
+        (CloudProvider.SCALEWAY, "scaleway.yml", re.compile("")),
+        (CloudProvider.SCALEWAY, "scw/", re.compile("")),
+
+        (CloudProvider.OVHCLOUD, "terraform", re.compile(r"ovh")),
+        (CloudProvider.OVHCLOUD, "ovh.yml", re.compile("")),
+        (CloudProvider.OVHCLOUD, "ovh.conf", re.compile("")),
+
+        (CloudProvider.HETZNER, "terraform", re.compile(r"hetzner|hcloud")),
+        (CloudProvider.HETZNER, "hetzner.yml", re.compile("")),
+        (CloudProvider.HETZNER, "hcloud/", re.compile("")),
+
+        (CloudProvider.EXOSCALE, "terraform", re.compile(r"exoscale")),
+        (CloudProvider.EXOSCALE, "exoscale.yml", re.compile("")),
+        (CloudProvider.EXOSCALE, "exo/", re.compile("")),
+
+        (CloudProvider.IONOS, "terraform", re.compile(r"ionos")),
+        (CloudProvider.IONOS, "ionos.yml", re.compile("")),
+
+        (CloudProvider.GCORE, "terraform", re.compile(r"gcore")),
+        (CloudProvider.GCORE, "gcore.yml", re.compile("")),
+
+        # PaaS providers
+        (CloudProvider.HEROKU, "Procfile", re.compile("")),
+        (CloudProvider.HEROKU, "heroku.yml", re.compile("")),
+        (CloudProvider.HEROKU, "app.json", re.compile(r'(?s)^(?=.*"name").*"buildpacks"')),
+
+        (CloudProvider.VERCEL, "vercel.json", re.compile("")),
+        (CloudProvider.VERCEL, "now.json", re.compile("")),
+        (CloudProvider.VERCEL, ".vercel/", re.compile("")),
+
+        (CloudProvider.NETLIFY, "netlify.toml", re.compile("")),
+        (CloudProvider.NETLIFY, "_headers", re.compile("")),
+        (CloudProvider.NETLIFY, "_redirects", re.compile("")),
+
+        (CloudProvider.RAILWAY, "railway.json", re.compile("")),
+        (CloudProvider.RAILWAY, "railway.toml", re.compile("")),
+        (CloudProvider.RAILWAY, "railway.app", re.compile("")),
+
+        (CloudProvider.RENDER, "render.yaml", re.compile("")),
+        (CloudProvider.RENDER, "render.com/", re.compile("")),
+
+        (CloudProvider.FLY_IO, "fly.toml", re.compile("")),
+        (CloudProvider.FLY_IO, "fly.io/", re.compile("")),
+        (CloudProvider.FLY_IO, ".fly/", re.compile("")),
+
+        (CloudProvider.DIGITAL_OCEAN, "terraform", re.compile(r"digitalocean")),
+        (CloudProvider.DIGITAL_OCEAN, ".do/", re.compile("")),
+        (CloudProvider.DIGITAL_OCEAN, "do.yml", re.compile("")),
+
+        (CloudProvider.VULTR, "terraform", re.compile(r"vultr")),
+        (CloudProvider.VULTR, "vultr.yml", re.compile("")),
+
+        (CloudProvider.LINODE, "terraform", re.compile(r"linode|akamai")),
+        (CloudProvider.LINODE, "linode.yml", re.compile("")),
+    )
+
+    # Provider-specific packages looked for in dependency manifests, in detection order
+    PROVIDER_PACKAGES = {
+        CloudProvider.AWS: re.compile(r"aws-sdk|@aws-sdk/|boto3|aws-cdk"),
+        CloudProvider.GCP: re.compile(r"@google-cloud/|google-cloud-|gcloud"),
+        CloudProvider.AZURE: re.compile(r"@azure/|azure-"),
+        CloudProvider.HEROKU: re.compile(r"heroku"),
+        CloudProvider.VERCEL: re.compile(r"vercel|@vercel/"),
+        CloudProvider.NETLIFY: re.compile(r"netlify-cli|netlify-"),
+        CloudProvider.SCALEWAY: re.compile(r"scaleway"),
+        CloudProvider.HETZNER: re.compile(r"hetzner|hcloud"),
+    }
+
+    # Framework indicators lowercased once, to match lowercased file contents
+    _FRAMEWORK_INDICATORS_LOWER = {framework: [i.lower() for i in indicators]
+                                   for framework, indicators in FRAMEWORK_INDICATORS.items()}
+
+    # Indicator tables pre-split into (suffixes, substrings) once, at class creation
+    _LANGUAGE_SPLIT = {lang: _split_indicators(inds) for lang, inds in LANGUAGE_INDICATORS.items()}
+    _DEPLOYMENT_SPLIT = {key: _split_indicators(inds) for key, inds in DEPLOYMENT_INDICATORS.items()}
+
+    # Every substring (non-wildcard) path indicator, resolved in one pass per analysis
+    _PATH_INDICATORS = set()
+    for _indicators in (*LANGUAGE_INDICATORS.values(), *DEPLOYMENT_INDICATORS.values(),
+                        *OBSERVABILITY_INDICATORS.values()):
+        _PATH_INDICATORS.update(i for i in _indicators if not i.startswith("*"))
+    _PATH_INDICATORS = frozenset(_PATH_INDICATORS)
+    del _indicators
+
+    # Deployment indicators grouped by the compute platform they imply
+    _PLATFORM_INDICATORS: Dict[ComputePlatform, Tuple[str, ...]] = {}
+    for (_name, _platform), _indicators in DEPLOYMENT_INDICATORS.items():
+        _PLATFORM_INDICATORS[_platform] = _PLATFORM_INDICATORS.get(_platform, ()) + tuple(_indicators)
+    del _name, _platform, _indicators
+
+    # Only this much of each dependency manifest is inspected: the checks are short
+    # package-name substrings and manifests can run to megabytes. Provider and IaC
+    # files (Terraform, serverless.yml, template.yaml) are read in full, since a
+    # matching resource can sit anywhere in them
+    _READ_PREFIX_BYTES = 16 * 1024
+    _PREFIX_READ_FILES = frozenset(("package.json", "requirements.txt", "pom.xml", "build.gradle"))
+
+    # Upper bound on threads used to overlap config file reads
+    _PREFETCH_WORKERS = 8
+
+    # Directories never worth indexing: VCS metadata, dependencies, build output
+    _SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", "dist", "build", ".venv"})
+
+    # Compute platforms in detection priority: more specific platforms first
+    _PLATFORM_PRIORITY = (
+        ComputePlatform.DOCKER_COMPOSE,
+        ComputePlatform.SERVERLESS_LAMBDA,
+        ComputePlatform.SERVERLESS_CLOUD_RUN,
+        ComputePlatform.SERVERLESS_CLOUD_FUNCTIONS,
+        ComputePlatform.PAAS_HEROKU,
+        ComputePlatform.PAAS_VERCEL,
+        ComputePlatform.PAAS_NETLIFY,
+        ComputePlatform.PAAS_RAILWAY,
+        ComputePlatform.PAAS_RENDER,
+        ComputePlatform.PAAS_FLY_IO,
+        ComputePlatform.KUBERNETES_K3S,
+        ComputePlatform.KUBERNETES_SELF,
+        ComputePlatform.KUBERNETES_AKS,
+        ComputePlatform.KUBERNETES_GKE,
+        ComputePlatform.KUBERNETES_EKS,
+        ComputePlatform.KUBERNETES,
+        ComputePlatform.VM,
+        ComputePlatform.CONTAINER,
+    )
+
     def __init__(self, repo_path: str):
         self.repo_path = Path(repo_path).resolve()
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
+        self._file_index: Optional[_FileIndex] = None
+        # Lowercased file contents by relative path (None if unreadable)
+        self._read_cache: Dict[str, Optional[str]] = {}
+
+    def _index(self, files: List[str]) -> _FileIndex:
+        """Index for a file list, built once and reused across detectors"""
+        index = self._file_index
+        if index is None or index.files is not files:
+            index = self._file_index = _FileIndex.build(files, self._PATH_INDICATORS)
+        return index
 
     def analyze(self) -> RepositoryAnalysis:
         """Perform comprehensive repository analysis"""
+        self._read_cache.clear()
         all_files = self._get_all_files()
+        index = self._index(all_files)
+
+        # Detectors that read file contents run on worker threads so their I/O overlaps;
+        # the rest only consult the path index. Racing reads of the same file at worst
+        # read it twice, since the read cache is a plain dict
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            frameworks = pool.submit(self._detect_frameworks, all_files)
+            cloud_provider = pool.submit(self._detect_cloud_provider, all_files)
+            has_wasm = pool.submit(self._detect_wasm, all_files)
+
+            analysis = RepositoryAnalysis(
+                path=str(self.repo_path),
+                languages=self._detect_languages(all_files),
+                frameworks=frameworks.result(),
+                deployment_configs=self._detect_deployment(all_files),
+                observability_tools=self._detect_observability(all_files),
+                cloud_provider=cloud_provider.result(),
+                compute_platform=self._detect_compute_platform(all_files),
+                has_docker=self._has_file(all_files, "Dockerfile"),
+                has_helm=self._has_file(all_files, "Chart.yaml"),
+                has_terraform=self._has_any_extension(all_files, ".tf"),
+                has_wasm=has_wasm.result(),
+                all_files=all_files,
+                basenames=index.basenames,
+                suffixes=index.suffixes
+            )
 
-        return RepositoryAnalysis(
-            path=str(self.repo_path),
-            languages=self._detect_languages(all_files),
-            frameworks=self._detect_frameworks(all_files),
-            deployment_configs=self._detect_deployment(all_files),
-            observability_tools=self._detect_observability(all_files),
-            cloud_provider=self._detect_cloud_provider(all_files),
-            compute_platform=self._detect_compute_platform(all_files),
-            has_docker=self._has_file(all_files, "Dockerfile"),
-            has_helm=self._has_file(all_files, "Chart.yaml"),
-            has_terraform=self._has_any_extension(all_files, ".tf"),
-            has_wasm=self._detect_wasm(all_files),
-            all_files=all_files
-        )
+        # The index holds three more copies of every path (lowercased list, both
+        # blobs) and the read cache up to 16 KiB per inspected file; the analysis
+        # only keeps all_files and the name sets, so drop the rest
+        self._file_index = None
+        self._read_cache.clear()
+        return analysis
 
     def _get_all_files(self) -> List[str]:
         """Get all files in repository"""
         files = []
+        base = len(os.path.join(str(self.repo_path), ""))
+        stack = [str(self.repo_path)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        # DirEntry answers these from the readdir result, no stat per path
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self._SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            # Convert to relative path
+                            files.append(entry.path[base:])
+            except OSError:
+                continue
+            # Descend in listing order, each directory's files before its subdirectories
+            stack.extend(reversed(subdirs))
+        return files
+
+    def _read_lower(self, rel_path: str) -> Optional[str]:
+        """Read and lowercase a repository file once per analysis; None if unreadable"""
         try:
-            for item in self.repo_path.rglob("*"):
-                if item.is_file():
-                    # Convert to relative path
-                    rel_path = item.relative_to(self.repo_path)
-                    files.append(str(rel_path))
-        except PermissionError:
+            return self._read_cache[rel_path]
+        except KeyError:
             pass
-        return files
+        content = self._read_cache[rel_path] = self._load_lower(rel_path)
+        return content
+
+    def _load_lower(self, rel_path: str) -> Optional[str]:
+        """Read and ASCII-lowercase a repository file (a manifest's prefix), bypassing the cache"""
+        limit = self._READ_PREFIX_BYTES if rel_path in self._PREFIX_READ_FILES else -1
+        try:
+            with open(self.repo_path / rel_path, "rb") as f:
+                data = f.read(limit)
+        except OSError:
+            return None
+        return data.translate(_ASCII_LOWER).decode("utf-8", "ignore")
+
+    def _prefetch(self, rel_paths: List[str]) -> None:
+        """Read not-yet-cached files concurrently so their open/read latencies overlap"""
+        missing = [p for p in dict.fromkeys(rel_paths) if p not in self._read_cache]
+        if len(missing) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(self._PREFETCH_WORKERS, len(missing))) as pool:
+            self._read_cache.update(zip(missing, pool.map(self._load_lower, missing)))
 
     def _detect_languages(self, files: List[str]) -> List[Language]:
         """Detect programming languages from files"""
         detected = set()
+        index = self._index(files)
 
-        for lang, indicators in self.LANGUAGE_INDICATORS.items():
-            for indicator in indicators:
-                if indicator.startswith("*"):
-                    # Extension pattern
-                    ext = indicator.replace("*", "")
-                    if any(f.endswith(ext) for f in files):
-                        detected.add(lang)
-                        break
-                else:
-                    # Filename pattern
-                    if any(indicator in f for f in files):
-                        detected.add(lang)
-                        break
+        for lang, split in self._LANGUAGE_SPLIT.items():
+            if index.matches(split):
+                detected.add(lang)
 
         return list(detected) if detected else [Language.UNKNOWN]
 
     def _detect_frameworks(self, files: List[str]) -> List[str]:
         """Detect frameworks from dependency files"""
         detected = []
+        manifests = [f for f in files if f in ("requirements.txt", "package.json", "pom.xml", "Gemfile")]
 
-        for framework, indicators in self.FRAMEWORK_INDICATORS.items():
+        for framework, indicators in self._FRAMEWORK_INDICATORS_LOWER.items():
             for indicator in indicators:
                 # Check in dependency files
-                for file in files:
-                    if file in ["requirements.txt", "package.json", "pom.xml", "Gemfile"]:
-                        file_path = self.repo_path / file
-                        if file_path.exists():
-                            content = file_path.read_text().lower()
-                            if indicator.lower() in content:
-                                detected.append(framework)
-                                break
+                for file in manifests:
+                    content = self._read_lower(file)
+                    if content is not None and indicator in content:
+                        detected.append(framework)
+                        break
 
         return list(set(detected))
 
     def _detect_deployment(self, files: List[str]) -> List[str]:
         """Detect deployment configurations"""
         detected = []
+        index = self._index(files)
 
-        for name, platform in self.DEPLOYMENT_INDICATORS.items():
-            deployment_name, platform_type = name
-            for indicator in platform:
-                if indicator.startswith("*"):
-                    ext = indicator.replace("*", "")
-                    if any(f.endswith(ext) for f in files):
-                        detected.append(deployment_name)
-                        break
-                elif any(indicator in f for f in files):
-                    detected.append(deployment_name)
-                    break
+        for (deployment_name, platform_type), split in self._DEPLOYMENT_SPLIT.items():
+            if index.matches(split):
+                detected.append(deployment_name)
 
         return detected
 
     def _detect_observability(self, files: List[str]) -> List[str]:
         """Detect existing observability tools"""
         detected = []
+        index = self._index(files)
 
         for tool, indicators in self.OBSERVABILITY_INDICATORS.items():
-            for indicator in indicators:
-                if any(indicator in f for f in files):
-                    detected.append(tool)
-                    break
+            if any(index.has_substring(indicator) for indicator in indicators):
+                detected.append(tool)
 
         return detected
 
     def _detect_cloud_provider(self, files: List[str]) -> CloudProvider:
         """Detect cloud provider from configuration files and metadata"""
-
-        # Check specific provider indicators
-        provider_indicators = {
-            # AWS
-            CloudProvider.AWS: [
-                ("terraform", lambda c: "aws_" in c or "hashicorp/aws" in c),
-                ("serverless", lambda c: "aws:" in c or "aws-iam" in c),
-                ("template.yaml", lambda c: "aws:aws:" in c or "AWS::" in c),
-                ("Procfile", lambda c: False),  # Exclude from AWS check
-            ],
-
-            # GCP
-            CloudProvider.GCP: [
-                ("cloudbuild.yaml", lambda c: True),
-                ("app.yaml", lambda c: "runtime:" in c),  # Cloud Run app.yaml
-                ("main.py", lambda c: False),  # Exclude generic .py
-                ("terraform", lambda c: "google" in c and "google_compute" in c),
-            ],
-
-            # Azure
-            CloudProvider.AZURE: [
-                ("azure-pipelines", lambda c: True),
-                ("main.bicep", lambda c: True),
-                ("terraform", lambda c: "azurerm" in c),
-                ("template.yaml", lambda c: "azure:" in c),
-            ],
-
-            # European providers
-            CloudProvider.SCALEWAY: [
-                ("terraform", lambda c: "scaleway" in c or "scaleway" in c),
-                ("scaleway.yml", lambda c: True),
-                ("scw/", lambda c: True),
-            ],
-
-            CloudProvider.OVHCLOUD: [
-                ("terraform", lambda c: "ovh" in c),
-                ("ovh.yml", lambda c: True),
-                ("ovh.conf", lambda c: True),
-            ],
-
-            CloudProvider.HETZNER: [
-                ("terraform", lambda c: "hetzner" in c or "hcloud" in c),
-                ("hetzner.yml", lambda c: True),
-                ("hcloud/", lambda c: True),
-            ],
-
-            CloudProvider.EXOSCALE: [
-                ("terraform", lambda c: "exoscale" in c),
-                ("exoscale.yml", lambda c: True),
-                ("exo/", lambda c: True),
-            ],
-
-            CloudProvider.IONOS: [
-                ("terraform", lambda c: "ionos" in c),
-                ("ionos.yml", lambda c: True),
-            ],
-
-            CloudProvider.GCORE: [
-                ("terraform", lambda c: "gcore" in c),
-                ("gcore.yml", lambda c: True),
-            ],
-
-            # PaaS providers
-            CloudProvider.HEROKU: [
-                ("Procfile", lambda c: True),
-                ("heroku.yml", lambda c: True),
-                ("app.json", lambda c: '"name"' in c and '"buildpacks"' in c),
-            ],
-
-            CloudProvider.VERCEL: [
-                ("vercel.json", lambda c: True),
-                ("now.json", lambda c: True),
-                (".vercel/", lambda c: True),
-            ],
-
-            CloudProvider.NETLIFY: [
-                ("netlify.toml", lambda c: True),
-                ("_headers", lambda c: True),
-                ("_redirects", lambda c: True),
-            ],
-
-            CloudProvider.RAILWAY: [
-                ("railway.json", lambda c: True),
-                ("railway.toml", lambda c: True),
-                ("railway.app", lambda c: True),
-            ],
-
-            CloudProvider.RENDER: [
-                ("render.yaml", lambda c: True),
-                ("render.com/", lambda c: True),
-            ],
-
-            CloudProvider.FLY_IO: [
-                ("fly.toml", lambda c: True),
-                ("fly.io/", lambda c: True),
-                (".fly/", lambda c: True),
-            ],
-
-            CloudProvider.DIGITAL_OCEAN: [
-                ("terraform", lambda c: "digitalocean" in c),
-                (".do/", lambda c: True),
-                ("do.yml", lambda c: True),
-            ],
-
-            CloudProvider.VULTR: [
-                ("terraform", lambda c: "vultr" in c),
-                ("vultr.yml", lambda c: True),
-            ],
-
-            CloudProvider.LINODE: [
-                ("terraform", lambda c: "linode" in c or "akamai" in c),
-                ("linode.yml", lambda c: True),
-            ],
-        }
+        index = self._index(files)
+        patterns = {file_pattern for _, file_pattern, content_re in self.PROVIDER_INDICATORS
+                    if content_re is not None and file_pattern in index.blob_lower}
+        # Keep only the paths some provider pattern can match
+        candidates = [(f, lower) for f, lower in zip(files, index.files_lower)
+                      if any(p in lower for p in patterns)]
+        dep_files = [f for f in ("package.json", "requirements.txt", "pom.xml", "build.gradle") if f in files]
+        self._prefetch([f for f, _ in candidates] + dep_files)
 
         # Check each provider's indicators
-        for provider, indicators in provider_indicators.items():
-            for file_pattern, content_check in indicators:
-                # Check if file exists matching pattern
-                matching_files = [f for f in files if file_pattern in f.lower()]
-
-                for file in matching_files:
-                    file_path = self.repo_path / file
-                    if file_path.exists() and file_path.is_file():
-                        try:
-                            content = file_path.read_text().lower()
-                            if content_check(content):
-                                return provider
-                        except Exception:
-                            pass
+        for provider, file_pattern, content_re in self.PROVIDER_INDICATORS:
+            if file_pattern not in patterns:
+                continue
+            for file, lower in candidates:
+                if file_pattern in lower:
+                    content = self._read_lower(file)
+                    if content is not None and content_re.search(content):
+                        return provider
 
         # Check content of dependency files for provider hints
-        for dep_file in ["package.json", "requirements.txt", "pom.xml", "build.gradle"]:
-            if dep_file in files:
-                file_path = self.repo_path / dep_file
-                if file_path.exists():
-                    content = file_path.read_text().lower()
-
-                    # Check for provider-specific packages
-                    provider_packages = {
-                        CloudProvider.AWS: ["aws-sdk", "@aws-sdk/", "boto3", "aws-cdk"],
-                        CloudProvider.GCP: ["@google-cloud/", "google-cloud-", "gcloud"],
-                        CloudProvider.AZURE: ["@azure/", "azure-"],
-                        CloudProvider.HEROKU: ["heroku"],
-                        CloudProvider.VERCEL: ["vercel", "@vercel/"],
-                        CloudProvider.NETLIFY: ["netlify-cli", "netlify-"],
-                        CloudProvider.SCALEWAY: ["scaleway"],
-                        CloudProvider.HETZNER: ["hetzner", "hcloud"],
-                    }
-
-                    for provider, packages in provider_packages.items():
-                        if any(pkg in content for pkg in packages):
-                            return provider
+        for dep_file in dep_files:
+            content = self._read_lower(dep_file)
+            if content is not None:
+                for provider, packages_re in self.PROVIDER_PACKAGES.items():
+                    if packages_re.search(content):
+                        return provider
 
         # Default to unknown
         return CloudProvider.UNKNOWN
 
     def _detect_compute_platform(self, files: List[str]) -> ComputePlatform:
         """Detect compute platform"""
-        # Check in priority order: more specific platforms first
-        priority_order = [
-            ComputePlatform.DOCKER_COMPOSE,
-            ComputePlatform.SERVERLESS_LAMBDA,
-            ComputePlatform.SERVERLESS_CLOUD_RUN,
-            ComputePlatform.SERVERLESS_CLOUD_FUNCTIONS,
-            ComputePlatform.PAAS_HEROKU,
-            ComputePlatform.PAAS_VERCEL,
-            ComputePlatform.PAAS_NETLIFY,
-            ComputePlatform.PAAS_RAILWAY,
-            ComputePlatform.PAAS_RENDER,
-            ComputePlatform.PAAS_FLY_IO,
-            ComputePlatform.KUBERNETES_K3S,
-            ComputePlatform.KUBERNETES_SELF,
-            ComputePlatform.KUBERNETES_AKS,
-            ComputePlatform.KUBERNETES_GKE,
-            ComputePlatform.KUBERNETES_EKS,
-            ComputePlatform.KUBERNETES,
-            ComputePlatform.VM,
-            ComputePlatform.CONTAINER,
-        ]
-
-        for target_platform in priority_order:
-            for (deployment_name, platform_type), indicators in self.DEPLOYMENT_INDICATORS.items():
-                if platform_type == target_platform:
-                    for indicator in indicators:
-                        if any(indicator in f for f in files):
-                            return platform_type
+        index = self._index(files)
+        # Deployment indicators match as plain substrings here, "*" included
+        for platform in self._PLATFORM_PRIORITY:
+            indicators = self._PLATFORM_INDICATORS.get(platform, ())
+            if any(index.has_substring(indicator) for indicator in indicators):
+                return platform
 
         return ComputePlatform.UNKNOWN
 
     def _has_file(self, files: List[str], filename: str) -> bool:
         """Check if a specific file exists"""
-        return any(f == filename or f.endswith(f"/{filename}") for f in files)
+        return filename in self._index(files).basenames
 
     def _has_any_extension(self, files: List[str], ext: str) -> bool:
         """Check if any file has the given extension"""
-        return any(f.endswith(ext) for f in files)
+        dotted, other, _ = _split_indicators(["*" + ext])
+        return self._index(files).has_any_suffix(dotted, other)
 
     def _detect_wasm(self, files: List[str]) -> bool:
         """Detect WebAssembly usage"""
@@ -1132,28 +1283,23 @@ class RepositoryAnalyzer:
         ]
 
         # Check for WASM files directly
-        if any(f.endswith(".wasm") or f.endswith(".wat") for f in files):
+        index = self._index(files)
+        if index.has_any_suffix(frozenset((".wasm", ".wat"))):
             return True
 
-        # Check for WASM in Cargo.toml (Rust WASM projects)
-        for file in files:
-            if file == "Cargo.toml":
-                try:
-                    content = (self.repo_path / file).read_text()
-                    if "wasm-bindgen" in content or "wasm-pack" in content or "w32" in content or "wasm" in content.lower():
-                        return True
-                except Exception:
-                    pass
-
-        # Check for package.json with WASM dependencies
-        for file in files:
-            if file == "package.json":
-                try:
-                    content = (self.repo_path / file).read_text()
-                    if "wasm" in content.lower() or "vite-plugin-wasm" in content:
-                        return True
-                except Exception:
-                    pass
+        # Manifests below only count at the repo root; the basename set rules most
+        # repositories out before the list scan
+        # Check for WASM in Cargo.toml (Rust WASM projects); shares the analysis read cache
+        if "Cargo.toml" in index.basenames and "Cargo.toml" in files:
+            content = self._read_lower("Cargo.toml")
+            if content is not None and ("wasm" in content or "w32" in content):
+                return True
+
+        # Check for package.json with WASM dependencies (e.g. vite-plugin-wasm)
+        if "package.json" in index.basenames and "package.json" in files:
+            content = self._read_lower("package.json")
+            if content is not None and "wasm" in content:
+                return True
 
         return False
 
@@ -1437,1927 +1583,203 @@ class EventHandlingRecommender:
         return None
 
 
-class EventHandlingPrescriber:
-    """Prescribes event handling based on environment with price-quality tiers"""
-
-    def __init__(self):
-        # Map (provider, platform) to tiered options generator
-        self.prescriptions = {
-            # Kubernetes prescriptions
-            (CloudProvider.UNKNOWN, ComputePlatform.KUBERNETES): self._kubernetes_tiered,
-            (CloudProvider.AWS, ComputePlatform.KUBERNETES): self._eks_tiered,
-            (CloudProvider.GCP, ComputePlatform.KUBERNETES): self._gke_tiered,
-            (CloudProvider.AZURE, ComputePlatform.KUBERNETES_AKS): self._aks_tiered,
-            (CloudProvider.SCALEWAY, ComputePlatform.KUBERNETES): self._scaleway_k8s_tiered,
-            (CloudProvider.HETZNER, ComputePlatform.KUBERNETES): self._hetzner_k8s_tiered,
-            (CloudProvider.OVHCLOUD, ComputePlatform.KUBERNETES): self._ovh_k8s_tiered,
-            (CloudProvider.EXOSCALE, ComputePlatform.KUBERNETES): self._exoscale_k8s_tiered,
-            (CloudProvider.DIGITAL_OCEAN, ComputePlatform.KUBERNETES): self._digitalocean_k8s_tiered,
-
-            # Serverless prescriptions
-            (CloudProvider.AWS, ComputePlatform.SERVERLESS): self._lambda_tiered,
-            (CloudProvider.AWS, ComputePlatform.SERVERLESS_LAMBDA): self._lambda_tiered,
-            (CloudProvider.GCP, ComputePlatform.SERVERLESS): self._cloud_run_tiered,
-            (CloudProvider.GCP, ComputePlatform.SERVERLESS_CLOUD_RUN): self._cloud_run_tiered,
-
-            # PaaS prescriptions
-            (CloudProvider.HEROKU, ComputePlatform.PAAS_HEROKU): self._heroku_tiered,
-            (CloudProvider.VERCEL, ComputePlatform.PAAS_VERCEL): self._vercel_tiered,
-            (CloudProvider.NETLIFY, ComputePlatform.PAAS_NETLIFY): self._netlify_tiered,
-            (CloudProvider.RAILWAY, ComputePlatform.PAAS_RAILWAY): self._railway_tiered,
-            (CloudProvider.RENDER, ComputePlatform.PAAS_RENDER): self._render_tiered,
-            (CloudProvider.FLY_IO, ComputePlatform.PAAS_FLY_IO): self._fly_io_tiered,
-
-            # VM prescriptions (European clouds)
-            (CloudProvider.SCALEWAY, ComputePlatform.VM): self._scaleway_vm_tiered,
-            (CloudProvider.HETZNER, ComputePlatform.VM): self._hetzner_vm_tiered,
-            (CloudProvider.OVHCLOUD, ComputePlatform.VM): self._ovh_vm_tiered,
-            (CloudProvider.EXOSCALE, ComputePlatform.VM): self._exoscale_vm_tiered,
-            (CloudProvider.IONOS, ComputePlatform.VM): self._ionos_vm_tiered,
-            (CloudProvider.DIGITAL_OCEAN, ComputePlatform.VM): self._digitalocean_vm_tiered,
-            (CloudProvider.VULTR, ComputePlatform.VM): self._vultr_vm_tiered,
-            (CloudProvider.LINODE, ComputePlatform.VM): self._linode_vm_tiered,
-
-            # Docker Compose
-            (CloudProvider.UNKNOWN, ComputePlatform.DOCKER_COMPOSE): self._docker_compose_tiered,
-            (CloudProvider.SELF_HOSTED, ComputePlatform.DOCKER_COMPOSE): self._docker_compose_tiered,
-
-            # Default
-            (CloudProvider.UNKNOWN, ComputePlatform.UNKNOWN): self._generic_tiered,
-        }
-
-    def prescribe(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Generate tiered prescription based on analysis with opinionated recommendations"""
-        key = (analysis.cloud_provider, analysis.compute_platform)
-        tiered_generator = self.prescriptions.get(key, self._generic_tiered)
-        options = tiered_generator(analysis)
-
-        # Use recommender to determine best tier
-        recommender = EventHandlingRecommender()
-        recommended_tier = recommender.recommend_tier(
-            analysis, analysis.cloud_provider, analysis.compute_platform
-        )
-
-        # Set primary to recommended tier
-        primary = next(
-            (o for o in options if o.tier == recommended_tier),
-            next((o for o in options if o.tier == "balanced"), options[0] if options else None)
-        )
+# Static tiered-option catalog, shipped next to the wizard
+_PROVIDERS_FILE = Path(__file__).resolve().parent / "data" / "providers.json"
 
-        # Store recommendation reasons for display
-        recommendation_reasons = recommender.recommendation_reasons[:]
-        observability_advice = recommender.get_observability_advice(
-            analysis, analysis.cloud_provider, analysis.compute_platform
-        )
-        agent_focus = recommender.recommend_agent_focus(analysis)
 
-        prescription = EventHandlingPrescription(
-            primary=primary,
-            options=options,
-            selected_tier=recommended_tier
-        )
+def _catalog_cache_path(raw: bytes, field_names: Tuple[str, ...]) -> Path:
+    """Pickled catalog location, keyed by the JSON and the option fields so neither is read stale"""
+    digest = hashlib.sha1(raw)
+    digest.update("\0".join(field_names).encode())
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "rlc-wizard" / f"catalog-{digest.hexdigest()}.pkl"
 
-        # Attach recommendation metadata
-        prescription.recommendation_reasons = recommendation_reasons
-        prescription.observability_advice = observability_advice
-        prescription.agent_focus = agent_focus
-        prescription.maturity_level = recommender.analyze_maturity(analysis)
-
-        return prescription
-
-    # ========== Tiered Option Creators ==========
-
-    def _create_option(self, tier: str, name: str, provider: str,
-                       metrics: str, logs: str, traces: str, alerts: str,
-                       ingestion_methods: List[str], integrations: List[str], commands: List[str],
-                       cost: str, complexity: str, pros: List[str], cons: List[str], best_for: List[str]) -> EventHandlingOption:
-        """Helper to create an EventHandlingOption"""
-        return EventHandlingOption(
-            name=name,
-            tier=tier,
-            metrics_source=metrics,
-            log_source=logs,
-            trace_source=traces,
-            alert_destination=alerts,
-            ingestion_methods=ingestion_methods,
-            required_integrations=integrations,
-            setup_commands=commands,
-            estimated_monthly_cost=cost,
-            setup_complexity=complexity,
-            pros=pros,
-            cons=cons,
-            best_for=best_for
-        )
 
-    # ========== Kubernetes Tiered Options (Best Price-Quality) ==========
-
-    def _kubernetes_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Kubernetes tiered options - self-hosted"""
-        return [
-            # BUDGET - Open source self-hosted
-            self._create_option(
-                tier="budget", name="Open Source Self-Hosted", provider="kubernetes",
-                metrics="Prometheus (self-hosted)",
-                logs="Loki (self-hosted to MinIO/S3)",
-                traces="Tempo (self-hosted to MinIO/S3)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus scraping", "Fluent Bit DaemonSet", "OpenTelemetry Collector basic"],
-                integrations=["kube-state-metrics", "cadvisor", "node-exporter"],
-                commands=["helm install kube-prometheus-stack prometheus-community/kube-prometheus-stack",
-                         "helm install loki grafana/loki-stack",
-                         "helm install tempo grafana/tempo"],
-                cost="<$30", complexity="High",
-                pros=["Zero software cost", "Full control", "No vendor lock-in", "Unlimited retention limits"],
-                cons=["High operational overhead", "Must manage storage", "No automatic scaling", "Security patches manual"],
-                best_for=["Small teams with DevOps expertise", "Budget-constrained projects", "Learning observability"]
-            ),
-            # BALANCED - LGTM Stack with object storage
-            self._create_option(
-                tier="balanced", name="LGTM Stack + Object Storage", provider="kubernetes",
-                metrics="Prometheus (VictoriaMetrics for cost)",
-                logs="Loki (Grafana Loki)",
-                traces="Tempo (Grafana Tempo)",
-                alerts="Alertmanager + Grafana OnCall",
-                ingestion_methods=["Prometheus scraping", "Fluent Bit", "OpenTelemetry Collector with sampling"],
-                integrations=["kube-state-metrics", "cadvisor", "node-exporter"],
-                commands=["helm install victoria-metrics victoria-metrics/victoria-metrics-k8s-stack",
-                         "helm install loki grafana/loki-stack",
-                         "helm install tempo grafana/tempo"],
-                cost="$30-100", complexity="Medium",
-                pros=["Excellent price-performance", "Object storage reduces costs", "Good community support", "Scalable architecture"],
-                cons=["Object storage costs vary", "Still requires maintenance", "Learning curve for Grafana stack"],
-                best_for=["Production workloads", "Growing teams", "Best price-quality ratio"]
-            ),
-            # PREMIUM - Managed observability
-            self._create_option(
-                tier="premium", name="Fully Managed Observability", provider="kubernetes",
-                metrics="Grafana Cloud Mimir/Prometheus",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall + PagerDuty",
-                ingestion_methods=["Grafana Agent", "Grafana Cloud native integrations", "OpenTelemetry Collector full"],
-                integrations=["Grafana Cloud Alloy", "All K8s metrics automatic"],
-                commands=["grafana cloud install", "Connect cluster via API"],
-                cost="$100-500", complexity="Low",
-                pros=["Zero maintenance", "Automatic scaling", "24/7 support included", "SLO features included"],
-                cons=["Higher cost at scale", "Vendor lock-in", "Data egress fees"],
-                best_for=["Enterprise production", "Teams without Ops resources", "Critical workloads"]
-            )
-        ]
-
-    # ========== AWS EKS Tiered Options ==========
-
-    def _eks_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """AWS EKS tiered options"""
-        return [
-            # BUDGET - Self-hosted on EC2
-            self._create_option(
-                tier="budget", name="Self-Hosted Prometheus + CloudWatch Logs", provider="aws-eks",
-                metrics="Prometheus (self-hosted on EC2)",
-                logs="CloudWatch Logs (basic)",
-                traces="AWS X-Ray (basic)",
-                alerts="Alertmanager (self-hosted) + CloudWatch Alarms",
-                ingestion_methods=["Prometheus operator", "CloudWatch agent", "AWS Distro for OTel"],
-                integrations=["aws-cloudwatch-metrics", "kube-state-metrics"],
-                commands=["kubectl install prometheus-operator", "Enable CloudWatch container insights"],
-                cost="$20-80", complexity="High",
-                pros=["No managed service fees", "Keep metrics in-cluster", "CloudWatch Logs integration"],
-                cons=["EC2 costs for Prometheus", "Manual scaling", "Maintenance overhead"],
-                best_for=["Cost-sensitive teams", "Existing EC2 infrastructure"]
-            ),
-            # BALANCED - AMP + CloudWatch
-            self._create_option(
-                tier="balanced", name="Amazon Managed Service for Prometheus", provider="aws-eks",
-                metrics="AMP (Amazon Managed Prometheus)",
-                logs="CloudWatch Logs with S3 archive",
-                traces="AWS X-Ray with OTel",
-                alerts="CloudWatch Alarms + Alertmanager",
-                ingestion_methods=["AMP remote write", "CloudWatch agent", "ADOT collector"],
-                integrations=["AWS AMP workspace", "CloudWatch Logs Insights", "X-Ray daemon"],
-                commands=["aws amp create-workspace", "Enable ADOT add-on on EKS"],
-                cost="$50-150", complexity="Medium",
-                pros=["No Prometheus maintenance", "AWS native integration", "Scalable", "S3 logs cheap long-term"],
-                cons=["AMP costs at scale", "Query API charges", "X-Ray limited tracing"],
-                best_for=["Production EKS", "AWS-centric teams", "Balanced cost/maintenance"]
-            ),
-            # PREMIUM - Datadog/New Relic
-            self._create_option(
-                tier="premium", name="Datadog / New Relic", provider="aws-eks",
-                metrics="Datadog Metrics / New Relic Metrics",
-                logs="Datadog Logs / New Relic Logs",
-                traces="Datadog APM / New Relic APM",
-                alerts="Datadog Monitor / New Relic Alerts + PagerDuty",
-                ingestion_methods=["Datadog Agent / New Relic Infrastructure", "Full instrumentation"],
-                integrations=["AWS integrations automatic", "All services monitored"],
-                commands=["Install Datadog Agent via Helm", "Enable AWS CloudWatch metrics sync"],
-                cost="$200-1000+", complexity="Low",
-                pros=["All-in-one platform", "Excellent UI", "Auto-instrumentation", "24/7 support"],
-                cons=["Expensive at scale", "Per-host pricing", "Vendor lock-in"],
-                best_for=["Enterprise", "Teams wanting turnkey", "Rapid deployment"]
-            )
-        ]
-
-    # ========== GCP GKE Tiered Options ==========
-
-    def _gke_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Google GKE tiered options"""
-        return [
-            # BUDGET - Self-hosted LGTM
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM Stack", provider="gcp-gke",
-                metrics="Prometheus (self-hosted on GKE)",
-                logs="Loki (to GCS)",
-                traces="Tempo (to GCS)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus scraping", "Fluent Bit", "OTel Collector"],
-                integrations=["kube-state-metrics", "cadvisor"],
-                commands=["helm install kube-prometheus-stack", "Use GCS for Loki/Tempo storage"],
-                cost="<$50", complexity="High",
-                pros=["Zero GCP monitoring fees", "GCS cheap storage", "Full control"],
-                cons=["Manage Prometheus cluster", "Manual setup", "Maintenance"],
-                best_for=["Budget-constrained GKE", "Teams with K8s expertise"]
-            ),
-            # BALANCED - Google Cloud Operations
-            self._create_option(
-                tier="balanced", name="Google Cloud Operations (Stackdriver)", provider="gcp-gke",
-                metrics="Cloud Monitoring (Prometheus compatible)",
-                logs="Cloud Logging with log-based metrics",
-                traces="Cloud Trace",
-                alerts="Cloud Alerting + Alertmanager export",
-                ingestion_methods=["Google Cloud Operations agent", "Auto-instrumentation"],
-                integrations=["GKE metrics automatic", "Service mesh metrics"],
-                commands=["gcloud container clusters update --enable-cloud-monitoring"],
-                cost="$50-200", complexity="Low",
-                pros=["Native GCP integration", "Automatic for GKE", "Good UI", "Logs and metrics together"],
-                cons=["Log ingestion costs", "Query syntax unique", "Less flexible than Prometheus"],
-                best_for=["GKE production", "GCP-native teams", "Moderate cost tolerance"]
-            ),
-            # PREMIUM - Grafana Cloud + GCP
-            self._create_option(
-                tier="premium", name="Grafana Cloud + GCP Integration", provider="gcp-gke",
-                metrics="Grafana Cloud Mimir",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent", "GCP metrics bridge"],
-                integrations=["GCP integration automatic", "Full stack visibility"],
-                commands=["Install Grafana Agent", "Connect GCP projects"],
-                cost="$150-400", complexity="Low",
-                pros=["Best of both worlds", "GCP logs via bridge", "Unified dashboards", "No maintenance"],
-                cons=["Multiple services to pay for", "GCP egress charges"],
-                best_for=["Multi-cloud environments", "Teams wanting Grafana ecosystem"]
-            )
-        ]
-
-    # ========== Azure AKS Tiered Options ==========
-
-    def _aks_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Azure AKS tiered options"""
-        return [
-            # BUDGET - Self-hosted
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM", provider="azure-aks",
-                metrics="Prometheus (self-hosted)",
-                logs="Loki (to Azure Blob)",
-                traces="Tempo (to Azure Blob)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "cadvisor"],
-                commands=["helm install kube-prometheus-stack"],
-                cost="<$40", complexity="High",
-                pros=["No Azure Monitor costs", "Blob storage cheap", "Open source"],
-                cons=["High maintenance", "Must manage Prometheus", "Self-support"],
-                best_for=["Budget AKS", "Open source preference"]
-            ),
-            # BALANCED - Azure Monitor Managed Prometheus
-            self._create_option(
-                tier="balanced", name="Azure Monitor + Container Insights", provider="azure-aks",
-                metrics="Azure Monitor Managed Prometheus",
-                logs="Azure Monitor Logs (Log Analytics)",
-                traces="Application Insights",
-                alerts="Azure Monitor Alerts + Action Groups",
-                ingestion_methods=["Azure Monitor agent", "AMA Metrics", "Dapr tracing"],
-                integrations=["Container Insights", "AKS metrics automatic"],
-                commands=["az aks enable-addons -a monitoring", "az aks update --enable-azure-monitor-metrics"],
-                cost="$60-180", complexity="Low",
-                pros=["Native Azure integration", "Container Insights excellent", "Managed Prometheus compatible", "Good UX"],
-                cons=["Log Analytics expensive at scale", "Query language (KQL) unique"],
-                best_for=["AKS production", "Azure-centric teams"]
-            ),
-            # PREMIUM - Datadog
-            self._create_option(
-                tier="premium", name="Datadog", provider="azure-aks",
-                metrics="Datadog Metrics",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                integrations=["Azure integration automatic"],
-                commands=["Install Datadog Agent"],
-                cost="$200-800", complexity="Low",
-                pros=["Turnkey monitoring", "Excellent dashboards", "Auto-instrumentation"],
-                cons=["Expensive", "Per-host pricing"],
-                best_for=["Enterprise AKS", "Rapid deployment"]
-            )
-        ]
+def _parse_option_catalog(raw: bytes, field_names: Tuple[str, ...]) -> Dict[str, Tuple[tuple, ...]]:
+    """Parse providers.json into per-option field tuples in field_names order"""
+    if orjson is not None:
+        data = orjson.loads(raw)
+    else:
+        import json
+        data = json.loads(raw)
+    # Providers repeat the same sources, commands and pros/cons (e.g. the Datadog and
+    # Grafana Cloud tiers); share one object per distinct value. The pickle cache
+    # memoizes by identity, so the sharing survives a reload
+    shared: Dict[Any, Any] = {}
 
-    # ========== Hetzner Kubernetes Tiered Options (Best EU Value) ==========
-
-    def _hetzner_k8s_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Hetzner Kubernetes - best value in Europe"""
-        return [
-            # BUDGET - Pure open source on Hetzner
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on Hetzner", provider="hetzner-k8s",
-                metrics="Prometheus (self-hosted on Hetzner VM)",
-                logs="Loki (to Hetzner Storage Box)",
-                traces="Tempo (to Hetzner Storage Box)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus scraping", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "hcloud-exporter"],
-                commands=["Deploy monitoring on dedicated Hetzner CX22 (~€8/month)",
-                         "hcloud volume create --size 10 --name loki-storage"],
-                cost="<€20/month", complexity="High",
-                pros=["Best value in EU", "Hetzner Storage Box included (free for small projects)", "No egress fees in EU", "Privacy compliant"],
-                cons=["Need dedicated monitoring VM", "High availability doubles cost", "Self-managed"],
-                best_for=["EU privacy requirements", "Budget-conscious EU startups", "Hetzner enthusiasts"]
-            ),
-            # BALANCED - Hetzner + Grafana Cloud
-            self._create_option(
-                tier="balanced", name="Grafana Cloud (EU region)", provider="hetzner-k8s",
-                metrics="Grafana Cloud Mimir (EU)",
-                logs="Grafana Cloud Loki (EU)",
-                traces="Grafana Cloud Tempo (EU)",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent", "Grafana Alloy"],
-                integrations=["Hetzner metrics", "Full observability"],
-                commands=["Deploy Grafana Agent on K8s", "Connect to Grafana Cloud EU"],
-                cost="€30-100/month", complexity="Low",
-                pros=["EU data residency", "No maintenance", "Excellent value", "Hetzner network fast"],
-                cons=["External service", "Learning curve"],
-                best_for=["Production EU workloads", "Best price-quality in EU"]
-            ),
-            # PREMIUM - European Datadog/New Relic
-            self._create_option(
-                tier="premium", name="Datadog EU", provider="hetzner-k8s",
-                metrics="Datadog (EU region)",
-                logs="Datadog Logs (EU)",
-                traces="Datadog APM (EU)",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                integrations=["Hetzner cloud integration"],
-                commands=["Install Datadog Agent"],
-                cost="€150-500/month", complexity="Low",
-                pros=["Full features", "EU region available", "Support"],
-                cons=["Expensive", "Vendor lock-in"],
-                best_for=["Enterprise with EU requirements"]
-            )
-        ]
+    def share(value):
+        if isinstance(value, list):
+            value = tuple(shared.setdefault(item, item) for item in value)
+        return shared.setdefault(value, value)
 
-    # ========== Scaleway Kubernetes Tiered Options ==========
-
-    def _scaleway_k8s_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Scaleway Kubernetes tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted with Scaleway Object Storage",
-                metrics="Prometheus (self-hosted)",
-                logs="Loki (to Scaleway Object Storage)",
-                traces="Tempo (to Scaleway Object Storage)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "Scaleway metrics"],
-                commands=["helm install kube-prometheus-stack", "Configure Object Storage bucket"],
-                cost="<€25/month", complexity="High",
-                pros=["Cheap storage in Paris/Amsterdam", "No egress fees", "EU privacy"],
-                cons=["Maintenance overhead"],
-                best_for=["Scaleway users", "EU startups"]
-            ),
-            # BALANCED - Scaleway Managed Services
-            self._create_option(
-                tier="balanced", name="Scaleway Managed Metrics + Self-Hosted Logs",
-                metrics="Scaleway Managed Prometheus (beta)",
-                logs="Loki (to Object Storage)",
-                traces="Tempo (to Object Storage)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["Scaleway metrics"],
-                commands=["Enable Managed Metrics in K8s pool"],
-                cost="€30-80/month", complexity="Medium",
-                pros=["Managed Prometheus", "Cheap log storage", "Good EU value"],
-                cons=["Still some self-hosting"],
-                best_for=["Scaleway production"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Grafana Cloud EU",
-                metrics="Grafana Cloud Mimir",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent"],
-                integrations=["Scaleway metrics"],
-                commands=["Connect Grafana Cloud"],
-                cost="€40-120/month", complexity="Low",
-                pros=["Turnkey", "EU region", "Good value"],
-                cons=["External service"],
-                best_for=["Production Scaleway K8s"]
-            )
-        ]
-
-    # ========== OVHcloud Kubernetes Tiered Options ==========
-
-    def _ovh_k8s_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """OVHcloud Kubernetes (Managed Kubernetes) tiered options"""
-        return [
-            # BUDGET - Self-hosted LGTM on OVHcloud
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on OVHcloud K8s", provider="ovhcloud-k8s",
-                metrics="Prometheus (self-hosted on K8s)",
-                logs="Loki (to OVH Object Storage)",
-                traces="Tempo (to OVH Object Storage)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "OVH metrics"],
-                commands=["helm install kube-prometheus-stack", "Configure OVH Object Storage for log storage"],
-                cost="<€25/month", complexity="High",
-                pros=["OVH storage very cheap", "Good EU coverage", "No egress fees", "EU data residency"],
-                cons=["Self-managed K8s monitoring", "Maintenance overhead"],
-                best_for=["OVHcloud K8s users", "French market", "EU startups"]
-            ),
-            # BALANCED - OVHcloud + Grafana Cloud EU
-            self._create_option(
-                tier="balanced", name="OVHcloud + Grafana Cloud (EU)", provider="ovhcloud-k8s",
-                metrics="Grafana Cloud Mimir (EU)",
-                logs="Grafana Cloud Loki (EU)",
-                traces="Grafana Cloud Tempo (EU)",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent", "Grafana Alloy"],
-                integrations=["OVH metrics", "Full observability"],
-                commands=["Deploy Grafana Agent on K8s", "Connect to Grafana Cloud EU region"],
-                cost="€30-90/month", complexity="Low",
-                pros=["Good EU value with Paris region", "No maintenance", "Turnkey setup"],
-                cons=["External service dependency"],
-                best_for=["Production OVHcloud K8s", "Best price-quality for EU"]
-            ),
-            # PREMIUM - Datadog EU
-            self._create_option(
-                tier="premium", name="OVHcloud + Datadog EU", provider="ovhcloud-k8s",
-                metrics="Datadog (EU region)",
-                logs="Datadog Logs (EU)",
-                traces="Datadog APM (EU)",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                integrations=["OVHcloud integration", "K8s integration"],
-                commands=["Install Datadog Agent on K8s"],
-                cost="€100-400/month", complexity="Low",
-                pros=["Full enterprise features", "EU region available", "Excellent support"],
-                cons=["Expensive", "Vendor lock-in"],
-                best_for=["Enterprise OVHcloud K8s"]
-            )
-        ]
-
-    # ========== Exoscale Kubernetes Tiered Options ==========
-
-    def _exoscale_k8s_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Exoscale Kubernetes tiered options"""
-        return [
-            # BUDGET - Self-hosted LGTM
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on Exoscale K8s", provider="exoscale-k8s",
-                metrics="Prometheus (self-hosted)",
-                logs="Loki (to Exoscale Object Storage - POL)",
-                traces="Tempo (to Exoscale POL)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "Exoscale metrics"],
-                commands=["helm install kube-prometheus-stack", "Configure Exoscale POL bucket"],
-                cost="<€25/month", complexity="High",
-                pros=["POL storage cheap", "Swiss privacy", "CH data centers", "No egress fees"],
-                cons=["Self-managed", "Maintenance overhead"],
-                best_for=["Exoscale K8s users", "Swiss market", "Privacy requirements"]
-            ),
-            # BALANCED - Exoscale + Grafana Cloud
-            self._create_option(
-                tier="balanced", name="Exoscale + Grafana Cloud (EU)", provider="exoscale-k8s",
-                metrics="Grafana Cloud Mimir",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent"],
-                integrations=["Exoscale metrics"],
-                commands=["Deploy Grafana Agent", "Connect to Grafana Cloud"],
-                cost="€30-80/month", complexity="Low",
-                pros=["No maintenance", "Good value", "EU support"],
-                cons=["External service"],
-                best_for=["Production Exoscale K8s"]
-            ),
-            # PREMIUM - Datadog
-            self._create_option(
-                tier="premium", name="Exoscale + Datadog", provider="exoscale-k8s",
-                metrics="Datadog",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                commands=["Install Datadog Agent"],
-                cost="€100-400/month", complexity="Low",
-                pros=["Full features", "Enterprise support"],
-                cons=["Expensive"],
-                best_for=["Enterprise Exoscale K8s"]
-            )
-        ]
-
-    # ========== DigitalOcean Kubernetes Tiered Options ==========
-
-    def _digitalocean_k8s_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """DigitalOcean Kubernetes (DOKS) tiered options"""
-        return [
-            # BUDGET - Self-hosted LGTM
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on DOKS", provider="digitalocean-k8s",
-                metrics="Prometheus (self-hosted on DOKS)",
-                logs="Loki (to DO Spaces - S3 compatible)",
-                traces="Tempo (to DO Spaces)",
-                alerts="Alertmanager",
-                ingestion_methods=["Prometheus operator", "Fluent Bit", "OTel"],
-                integrations=["kube-state-metrics", "DO metrics"],
-                commands=["helm install kube-prometheus-stack", "Create DO Spaces bucket"],
-                cost="<$30/month", complexity="High",
-                pros=["DO Spaces cheap", "Simple", "Good value"],
-                cons=["Self-managed", "Single region mostly"],
-                best_for=["DO K8s users", "Small workloads"]
-            ),
-            # BALANCED - DO + Grafana Cloud
-            self._create_option(
-                tier="balanced", name="DigitalOcean + Grafana Cloud", provider="digitalocean-k8s",
-                metrics="Grafana Cloud Mimir",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent"],
-                integrations=["DO metrics"],
-                commands=["Deploy Grafana Agent"],
-                cost="$40-120/month", complexity="Low",
-                pros=["No maintenance", "Good price-quality", "Easy setup"],
-                cons=["External service"],
-                best_for=["Production DOKS"]
-            ),
-            # PREMIUM - Datadog
-            self._create_option(
-                tier="premium", name="DigitalOcean + Datadog", provider="digitalocean-k8s",
-                metrics="Datadog",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                commands=["Install Datadog Agent"],
-                cost="$150-500/month", complexity="Low",
-                pros=["Full features", "Excellent DO integration"],
-                cons=["Expensive"],
-                best_for=["Enterprise DOKS"]
-            )
-        ]
-
-    # ========== Serverless Tiered Options ==========
-
-    def _lambda_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """AWS Lambda tiered options"""
-        return [
-            # BUDGET - CloudWatch only
-            self._create_option(
-                tier="budget", name="CloudWatch Native", provider="aws-lambda",
-                metrics="CloudWatch Metrics",
-                logs="CloudWatch Logs (standard retention)",
-                traces="X-Ray (basic)",
-                alerts="CloudWatch Alarms → SNS",
-                ingestion_methods=["CloudWatch automatic", "Enable X-Ray in Lambda config"],
-                integrations=["Lambda metrics automatic"],
-                commands=["aws lambda update-function-configuration --function-name <name> --tracing-config Mode=Active"],
-                cost="<$20", complexity="Low",
-                pros=["Included with Lambda", "Zero setup", "AWS native"],
-                cons=["Limited querying", "Logs expensive at scale", "X-Ray limited"],
-                best_for=["Simple Lambda functions", "Low volume"]
-            ),
-            # BALANCED - CloudWatch + log export
-            self._create_option(
-                tier="balanced", name="CloudWatch + S3 Export + Honeycomb",
-                metrics="CloudWatch Metrics",
-                logs="CloudWatch Logs → S3 (via subscription filter)",
-                traces="Honeycomb (or X-Ray enhanced)",
-                alerts="CloudWatch Alarms + Honeycomb triggers",
-                ingestion_methods=["CloudWatch Logs subscription filter to S3"],
-                integrations=["Lambda metrics", "S3 for log archival"],
-                commands=["aws logs put-subscription-filter", "Export to Honeycomb via firehose"],
-                cost="$20-60", complexity="Medium",
-                pros=["Cheap long-term logs in S3", "Honeycomb for fast queries", "Best price-quality"],
-                cons=["Setup complexity"],
-                best_for=["Production Lambda", "Cost optimization"]
-            ),
-            # PREMIUM - Datadog/New Relic
-            self._create_option(
-                tier="premium", name="Datadog Serverless",
-                metrics="Datadog Metrics",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Lambda layer"],
-                integrations=["AWS Lambda automatic"],
-                commands=["Add Datadog layer to Lambda"],
-                cost="$50-200", complexity="Low",
-                pros=["Turnkey serverless monitoring", "Auto-tracing", "Great UX"],
-                cons=["Expensive"],
-                best_for=["Enterprise Lambda", "Complex architectures"]
-            )
-        ]
-
-    def _cloud_run_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Google Cloud Run tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Cloud Monitoring + Cloud Logging Basic",
-                metrics="Cloud Monitoring (free tier)",
-                logs="Cloud Logging (basic)",
-                traces="Cloud Trace (basic)",
-                alerts="Cloud Alerting",
-                ingestion_methods=["Google Cloud Operations agent (optional)"],
-                integrations=["Cloud Run metrics automatic"],
-                commands=["gcloud run services deploy"],
-                cost="<$15", complexity="Low",
-                pros=["Free monitoring tier generous", "Automatic", "Good for small apps"],
-                cons=["Logs get expensive", "Query costs"],
-                best_for=["Small Cloud Run apps", "Hobby projects"]
-            ),
-            # BALANCED - Loki bridge
-            self._create_option(
-                tier="balanced", name="Cloud Monitoring + Loki Logs",
-                metrics="Cloud Monitoring",
-                logs="Loki (self-hosted or Grafana Cloud)",
-                traces="Cloud Trace",
-                alerts="Cloud Alerting",
-                ingestion_methods=["Log export to Loki", "Cloud Monitoring native"],
-                integrations=["Cloud Run metrics"],
-                commands=["Set up log sink to Loki", "Use Cloud Monitoring"],
-                cost="$20-50", complexity="Medium",
-                pros=["Cheap logs in Loki", "Native metrics", "Good balance"],
-                cons=["Two systems to manage"],
-                best_for=["Production Cloud Run", "Cost optimization"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Grafana Cloud",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent"],
-                integrations=["GCP logs/metrics bridge"],
-                cost="$50-150", complexity="Low",
-                pros=["Unified platform", "No maintenance", "Excellent"],
-                cons=["Higher cost"],
-                best_for=["Production Cloud Run", "Multi-cloud"]
-            )
-        ]
-
-    # ========== PaaS Tiered Options ==========
-
-    def _heroku_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Heroku tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Heroku Logs + Free Metrics", provider="heroku",
-                metrics="Heroku Metrics (free tier)",
-                logs="Heroku Logplex ( drains to self-hosted Loki)",
-                traces="Basic APM (self-instrumented)",
-                alerts="Heroku Alerts",
-                ingestion_methods=["Log drain to self-hosted Loki"],
-                integrations=["Heroku dyno metrics"],
-                commands=["heroku drains:add https://loki.example.com/loki/api/v1/push"],
-                cost="<$25", complexity="High",
-                pros=["Low cost", "Control over logs", "No vendor lock-in for logs"],
-                cons=["Self-hosted Loki", "Limited metrics retention"],
-                best_for=["Budget Heroku apps", "Privacy needs"]
-            ),
-            # BALANCED - Papertrail
-            self._create_option(
-                tier="balanced", name="Heroku + Papertrail/Loki", provider="heroku",
-                metrics="Heroku Metrics + Librato/New Relic Basic",
-                logs="Papertrail or self-hosted Loki",
-                traces="APM Basic",
-                alerts="Heroku Alerts",
-                ingestion_methods=["Log drain", "APM setup"],
-                integrations=["Heroku addons"],
-                commands=["heroku addons:create papertrail", "or self-host Loki"],
-                cost="$25-75", complexity="Medium",
-                pros=["Papertrail great for logs", "Reasonable cost", "Easy setup"],
-                cons=["Multiple services"],
-                best_for=["Production Heroku", "Small teams"]
-            ),
-            # PREMIUM - Heroku + Datadog
-            self._create_option(
-                tier="premium", name="Heroku + Datadog", provider="heroku",
-                metrics="Datadog",
-                logs="Datadog Logs (via drain or APM)",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog APM", "Log drain"],
-                integrations=["Heroku integration automatic"],
-                commands=["heroku addons:create datadog"],
-                cost="$75-250", complexity="Low",
-                pros=["Turnkey", "Excellent monitoring", "APM included"],
-                cons=["Expensive"],
-                best_for=["Enterprise Heroku", "Complex apps"]
-            )
-        ]
-
-    def _vercel_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Vercel tiered options"""
-        return [
-            # BUDGET - Vercel native
-            self._create_option(
-                tier="budget", name="Vercel Analytics + Log Drains", provider="vercel",
-                metrics="Vercel Analytics (free tier)",
-                logs="Vercel Logs → self-hosted Loki",
-                traces="OpenTelemetry (self-instrumented)",
-                alerts="Vercel Notifications",
-                ingestion_methods=["Log drain to self-hosted Loki"],
-                integrations=["Vercel edge metrics"],
-                commands=["Add log drain in Vercel dashboard"],
-                cost="<$20", complexity="High",
-                pros=["Free Vercel Analytics", "Control logs", "Edge metrics included"],
-                cons=["Self-hosted Loki", "Limited traces"],
-                best_for=["Vercel hobby projects", "Budget constrained"]
-            ),
-            # BALANCED - Vercel + Grafana Cloud
-            self._create_option(
-                tier="balanced", name="Vercel + Grafana Cloud", provider="vercel",
-                metrics="Vercel Analytics + Grafana Cloud",
-                logs="Grafana Cloud Loki (via drain)",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Log drain", "OTel instrumentation"],
-                integrations=["Vercel edge metrics", "Web Vitals"],
-                commands=["Configure log drain in Vercel"],
-                cost="$20-60", complexity="Medium",
-                pros=["Excellent edge monitoring", "Unified dashboard", "Reasonable cost"],
-                cons=["Two platforms"],
-                best_for=["Production Vercel apps", "E-commerce"]
-            ),
-            # PREMIUM - Vercel + Datadog
-            self._create_option(
-                tier="premium", name="Vercel + Datadog", provider="vercel",
-                metrics="Datadog + Vercel Analytics",
-                logs="Datadog Logs",
-                traces="Datadog RUM + APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Browser SDK", "APM"],
-                integrations=["Vercel integration"],
-                commands=["Install Datadog SDK"],
-                cost="$75-300", complexity="Low",
-                pros=["Full RUM + APM", "Turnkey", "Excellent for frontend"],
-                cons=["Expensive"],
-                best_for=["Enterprise Vercel", "Customer-facing apps"]
-            )
-        ]
-
-    def _netlify_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Netlify tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Netlify Functions + Self-Hosted Logs", provider="netlify",
-                metrics="Netlify Analytics (free)",
-                logs="Netlify Logs → self-hosted Loki",
-                traces="APM self-instrumented",
-                alerts="Netlify Notifications",
-                ingestion_methods=["Log drain"],
-                commands=["Configure log drain"],
-                cost="<$15", complexity="High",
-                pros=["Free tier generous", "Full control"],
-                cons=["Self-hosted", "Limited APM"],
-                best_for=["Netlify hobby sites"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Netlify + Grafana Cloud", provider="netlify",
-                metrics="Netlify Analytics + Grafana",
-                logs="Grafana Cloud Loki (via drain)",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Log drain", "OTel"],
-                commands=["Set up log drain"],
-                cost="$20-50", complexity="Medium",
-                pros=["Good balance", "Edge functions monitored"],
-                cons=["Setup required"],
-                best_for=["Production Netlify"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Netlify + Datadog", provider="netlify",
-                metrics="Datadog",
-                logs="Datadog Logs",
-                traces="Datadog RUM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog SDK"],
-                commands=["Install Datadog"],
-                cost="$50-200", complexity="Low",
-                pros=["Turnkey RUM monitoring"],
-                cons=["Cost"],
-                best_for=["Enterprise Netlify"]
-            )
-        ]
-
-    def _railway_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Railway tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Railway Metrics + Self-Hosted Logs", provider="railway",
-                metrics="Railway built-in metrics",
-                logs="Self-hosted Loki",
-                traces="OpenTelemetry",
-                alerts="Railway Notifications",
-                ingestion_methods=["Log forwarding"],
-                commands=["Set up log forwarder"],
-                cost="<$20", complexity="High",
-                pros=["Cheap entry", "Good built-in metrics"],
-                cons=["Self-hosted logs"],
-                best_for=["Railway MVPs"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Railway + Grafana Cloud", provider="railway",
-                metrics="Railway Metrics + Grafana",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Railway log forwarding"],
-                commands=["Connect Grafana Cloud"],
-                cost="$20-60", complexity="Low",
-                pros=["Full observability", "Easy setup"],
-                cons=["Cost adds up"],
-                best_for=["Production Railway"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Railway + Datadog", provider="railway",
-                metrics="Datadog",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog agent"],
-                commands=["Install Datadog"],
-                cost="$50-200", complexity="Low",
-                pros=["Turnkey"],
-                best_for=["Enterprise Railway"]
-            )
-        ]
-
-    def _render_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Render tiered options"""
-        return self._generic_paas_tiered("Render", ["Render metrics", "Render log drains"])
-
-    def _fly_io_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Fly.io tiered options"""
-        return [
-            # BUDGET - Fly native
-            self._create_option(
-                tier="budget", name="Fly.io Metrics + Self-Hosted Logs", provider="fly_io",
-                metrics="flyctl metrics",
-                logs="Self-hosted Loki (on Fly.io volume)",
-                traces="OTel basic",
-                alerts="Fly.io notifications",
-                ingestion_methods=["flyctl agent", "Loki on volume"],
-                commands=["fly volumes create loki-data", "Deploy Loki with flyctl"],
-                cost="<$25", complexity="High",
-                pros=["Cheap compute", "Volumes reasonably priced", "Edge network"],
-                cons=["Self-hosted logging"],
-                best_for=["Fly.io edge apps"]
-            ),
-            # BALANCED - Fly + Grafana
-            self._create_option(
-                tier="balanced", name="Fly.io + Grafana Cloud", provider="fly_io",
-                metrics="flyctl metrics + Grafana",
-                logs="Grafana Cloud Loki",
-                traces="Grafana Cloud Tempo",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Log forwarding"],
-                commands=["Set up log forwarder"],
-                cost="$30-80", complexity="Low",
-                pros=["Edge monitoring", "Good value"],
-                best_for=["Production Fly.io apps"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Fly.io + Datadog", provider="fly_io",
-                metrics="Datadog",
-                logs="Datadog Logs",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog agent"],
-                commands=["Install Datadog"],
-                cost="$75-250", complexity="Low",
-                pros=["Turnkey"],
-                best_for=["Enterprise Fly.io"]
-            )
-        ]
-
-    # ========== VM Tiered Options (European Clouds) ==========
-
-    def _hetzner_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Hetzner VM tiered options - BEST VALUE IN EU"""
-        return [
-            # BUDGET - All self-hosted on Hetzner
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on Hetzner VM", provider="hetzner",
-                metrics="Prometheus (on CX21 ~€4/mo)",
-                logs="Loki (same VM, Storage Box free)",
-                traces="Tempo (same VM)",
-                alerts="Alertmanager (same VM)",
-                ingestion_methods=["node_exporter on all VMs", "Fluent Bit", "OTel"],
-                integrations=["hcloud-exporter"],
-                commands=["Deploy on dedicated Hetzner VM", "hcloud volume create --size 10 --name monitoring"],
-                cost="<€10/month", complexity="High",
-                pros=["Incredible value - €10/month for full stack", "No EU egress fees", "Storage Box included free", "Privacy compliant"],
-                cons=["Single point of failure", "No HA unless double cost", "Maintenance overhead"],
-                best_for=["EU startups", "Hetzner users", "Budget-constrained projects", "Privacy requirements"]
-            ),
-            # BALANCED - Hetzner VMs + Grafana Cloud
-            self._create_option(
-                tier="balanced", name="Hetzner Compute + Grafana Cloud", provider="hetzner",
-                metrics="Grafana Cloud Mimir (EU region)",
-                logs="Grafana Cloud Loki (EU)",
-                traces="Grafana Cloud Tempo (EU)",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent on each VM"],
-                integrations=["hcloud-exporter"],
-                commands=["Deploy Grafana Agent", "Connect to Grafana Cloud EU"],
-                cost="€25-70/month", complexity="Low",
-                pros=["EU data residency", "No monitoring maintenance", "Hetzner compute cheap", "Best price-quality ratio in EU"],
-                cons=["External service"],
-                best_for=["Production EU infrastructure", "Teams wanting best value"]
-            ),
-            # PREMIUM - Hetzner + Datadog EU
-            self._create_option(
-                tier="premium", name="Hetzner + Datadog EU", provider="hetzner",
-                metrics="Datadog (EU region)",
-                logs="Datadog Logs (EU)",
-                traces="Datadog APM (EU)",
-                alerts="Datadog Monitor",
-                ingestion_methods=["Datadog Agent"],
-                commands=["Install Datadog Agent"],
-                cost="€100-400/month", complexity="Low",
-                pros=["Full features", "EU region", "Enterprise support"],
-                cons=["Expensive"],
-                best_for=["Enterprise with EU requirements"]
-            )
-        ]
-
-    def _scaleway_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Scaleway VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted on Scaleway", provider="scaleway",
-                metrics="Prometheus (on DEV1-S ~€8/mo)",
-                logs="Loki (to Object Storage)",
-                traces="Tempo (to Object Storage)",
-                alerts="Alertmanager",
-                ingestion_methods=["node_exporter", "Fluent Bit"],
-                commands=["Deploy on Scaleway DEV1-S"],
-                cost="<€15/month", complexity="High",
-                pros=["Good EU value", "Object storage cheap"],
-                cons=["Maintenance"],
-                best_for=["Scaleway users"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Scaleway + Grafana Cloud EU", provider="scaleway",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent"],
-                cost="€30-80/month", complexity="Low",
-                pros=["Paris/Amsterdam regions", "Good value"],
-                best_for=["Production Scaleway"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Scaleway + Datadog EU",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                alerts="Datadog Monitor",
-                cost="€100-400/month", complexity="Low",
-                pros=["Full features"],
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _ovh_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """OVHcloud VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on OVHcloud", provider="ovhcloud",
-                metrics="Prometheus (on Public Cloud instance)",
-                logs="Loki (to OVH Object Storage)",
-                traces="Tempo (to OVH Object Storage)",
-                alerts="Alertmanager",
-                ingestion_methods=["node_exporter", "Fluent Bit"],
-                commands=["Deploy on Public Cloud", "Use OVH Logs API"],
-                cost="<€20/month", complexity="High",
-                pros=["OVH storage very cheap", "Good EU coverage"],
-                cons=["Maintenance"],
-                best_for=["OVH users", "French market"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="OVHcloud + Grafana Cloud", provider="ovhcloud",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                alerts="Grafana OnCall",
-                cost="€30-90/month", complexity="Low",
-                pros=["Good EU value", "Paris region"],
-                best_for=["Production OVHcloud"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="OVHcloud + Datadog", provider="ovhcloud",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="€100-400/month", complexity="Low",
-                pros=["Enterprise features"],
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _exoscale_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Exoscale VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM", provider="exoscale",
-                metrics="Prometheus",
-                logs="Loki (to Exoscale POL)",
-                traces="Tempo (to POL)",
-                alerts="Alertmanager",
-                cost="<€20/month", complexity="High",
-                pros=["POL storage cheap", "Swiss privacy"],
-                best_for=["Exoscale users", "Swiss market"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Exoscale + Grafana Cloud", provider="exoscale",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                cost="€30-80/month", complexity="Low",
-                pros=["Good value"],
-                best_for=["Production"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Exoscale + Datadog", provider="exoscale",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="€100-400/month", complexity="Low",
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _ionos_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """IONOS VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM", provider="ionos",
-                metrics="Prometheus",
-                logs="Loki",
-                traces="Tempo",
-                cost="<€20/month", complexity="High",
-                best_for=["German market"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="IONOS + Grafana Cloud", provider="ionos",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                cost="€30-80/month", complexity="Low",
-                best_for=["Production"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="IONOS + Datadog", provider="ionos",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="€100-400/month", complexity="Low",
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _digitalocean_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """DigitalOcean VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on DO", provider="digitalocean",
-                metrics="Prometheus + do_exporter",
-                logs="Loki (to DO Spaces)",
-                traces="Tempo (to DO Spaces)",
-                alerts="Alertmanager",
-                cost="<$25/month", complexity="High",
-                pros=["DO Spaces reasonably priced", "do_exporter available"],
-                best_for=["DO users"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="DigitalOcean + Grafana Cloud", provider="digitalocean",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                cost="$30-80/month", complexity="Low",
-                pros=["Good integration"],
-                best_for=["Production DO"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="DigitalOcean + Datadog", provider="digitalocean",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="$100-400/month", complexity="Low",
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _vultr_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Vultr VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on Vultr", provider="vultr",
-                metrics="Prometheus + vultr_exporter",
-                logs="Loki (to Vultr Object Storage)",
-                traces="Tempo (to Object Storage)",
-                alerts="Alertmanager",
-                cost="<$25/month", complexity="High",
-                best_for=["Vultr users", "Budget VPS"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Vultr + Grafana Cloud", provider="vultr",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                cost="$30-80/month", complexity="Low",
-                best_for=["Production Vultr"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Vultr + Datadog", provider="vultr",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="$100-400/month", complexity="Low",
-                best_for=["Enterprise"]
-            )
-        ]
-
-    def _linode_vm_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Linode VM tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM on Linode", provider="linode",
-                metrics="Prometheus + linode_exporter",
-                logs="Loki (to Linode Object Storage)",
-                traces="Tempo (to Object Storage)",
-                alerts="Alertmanager",
-                cost="<$25/month", complexity="High",
-                best_for=["Linode users", "Akamai customers"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Linode + Grafana Cloud", provider="linode",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                cost="$30-80/month", complexity="Low",
-                best_for=["Production Linode"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Linode + Datadog", provider="linode",
-                metrics="Datadog",
-                logs="Datadog",
-                traces="Datadog APM",
-                cost="$100-400/month", complexity="Low",
-                best_for=["Enterprise"]
-            )
-        ]
-
-    # ========== Docker Compose Tiered Options ==========
-
-    def _docker_compose_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Docker Compose tiered options"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM in Compose", provider="docker",
-                metrics="Prometheus (container)",
-                logs="Loki (container, local volume)",
-                traces="Tempo (container, local volume)",
-                alerts="Alertmanager (container)",
-                ingestion_methods=["cAdvisor", "node_exporter on host", "Fluent Bit"],
-                integrations=["cAdvisor"],
-                commands=["Add monitoring services to docker-compose.yml", "docker-compose up -d prometheus loki tempo"],
-                cost="$0", complexity="High",
-                pros=["Free", "Full control", "Good for local/dev"],
-                cons=["Not production-ready", "No persistence unless configured"],
-                best_for=["Local development", "Testing", "Homelabs"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Docker Compose + Object Storage", provider="docker",
-                metrics="Prometheus (container)",
-                logs="Loki (container, logs to S3/MinIO)",
-                traces="Tempo (container, traces to S3/MinIO)",
-                alerts="Alertmanager",
-                ingestion_methods=["cAdvisor", "Fluent Bit with S3 output"],
-                integrations=["cAdvisor", "S3/MinIO"],
-                commands=["Use MinIO for local object storage", "Configure S3 endpoint for production"],
-                cost="$10-50", complexity="Medium",
-                pros=["Scalable storage", "Production-ready", "Still mostly self-hosted"],
-                cons=["Object storage costs", "Some maintenance"],
-                best_for=["Small production", "Single-server deployments"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Grafana Cloud + Docker Compose", provider="docker",
-                metrics="Grafana Cloud",
-                logs="Grafana Cloud",
-                traces="Grafana Cloud",
-                alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent sidecar"],
-                cost="$50-150", complexity="Low",
-                pros=["No maintenance", "Production ready", "Excellent observability"],
-                cons=["External dependency", "Cost"],
-                best_for=["Production Docker Compose", "Teams without Ops"]
-            )
-        ]
-
-    # ========== Generic Fallback ==========
-
-    def _generic_tiered(self, analysis: RepositoryAnalysis) -> List[EventHandlingOption]:
-        """Generic tiered options when platform unknown"""
-        return [
-            # BUDGET
-            self._create_option(
-                tier="budget", name="Self-Hosted LGTM Stack", provider="generic",
-                metrics="Prometheus", logs="Loki", traces="Tempo", alerts="Alertmanager",
-                ingestion_methods=["Prometheus scraping", "Fluent Bit", "OTel"],
-                integrations=["node_exporter", "app instrumentation"],
-                commands=["docker compose -f monitoring-stack.yml up -d"],
-                cost="<$50", complexity="High",
-                pros=["Open source", "No licensing", "Full control"],
-                cons=["Full self-hosting", "High maintenance"],
-                best_for=["General use", "Learning", "Self-hosting enthusiasts"]
-            ),
-            # BALANCED
-            self._create_option(
-                tier="balanced", name="Grafana Cloud", provider="generic",
-                metrics="Grafana Cloud", logs="Grafana Cloud", traces="Grafana Cloud", alerts="Grafana OnCall",
-                ingestion_methods=["Grafana Agent", "Grafana Alloy"],
-                integrations=["App instrumentation"],
-                commands=["Install Grafana Agent", "Connect to Grafana Cloud"],
-                cost="$50-150", complexity="Low",
-                pros=["No maintenance", "Good value", "Turnkey"],
-                cons=["External service", "Learning curve"],
-                best_for=["Production", "Multi-cloud", "Best price-quality"]
-            ),
-            # PREMIUM
-            self._create_option(
-                tier="premium", name="Datadog or New Relic", provider="generic",
-                metrics="Datadog/New Relic", logs="Datadog/New Relic", traces="Datadog/New Relic APM", alerts="Datadog/New Relic",
-                ingestion_methods=["Agent installation"],
-                integrations=["Full cloud integrations"],
-                commands=["Install agent", "Configure dashboards"],
-                cost="$200-1000", complexity="Low",
-                pros=["Turnkey", "Full features", "Enterprise support"],
-                cons=["Expensive", "Vendor lock-in"],
-                best_for=["Enterprise", "Fast setup", "No ops team"]
-            )
-        ]
-
-    def _kubernetes_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Standard Kubernetes prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "Prometheus scraping (/metrics endpoint)",
-                "Fluent Bit DaemonSet for logs",
-                "OpenTelemetry Collector for traces"
-            ],
-            required_integrations=[
-                "kube-state-metrics",
-                "cadvisor",
-                "node-exporter"
-            ],
-            setup_commands=[
-                "kubectl apply -f monitoring/prometheus/",
-                "kubectl apply -f monitoring/loki/",
-                "kubectl apply -f monitoring/tempo/",
-                "kubectl apply -f monitoring/fluent-bit/"
-            ]
-        )
-
-    def _eks_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """AWS EKS specific prescription"""
-        base = self._kubernetes_prescription(analysis)
-        base.ingestion_methods.extend([
-            "AWS CloudWatch adapter for Prometheus",
-            "AWS Distro for OpenTelemetry (ADOT)"
-        ])
-        return base
-
-    def _gke_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Google GKE specific prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Cloud Monitoring (Prometheus compatible)",
-            log_source="Cloud Logging",
-            trace_source="Cloud Trace",
-            alert_destination="Cloud Alerting",
-            ingestion_methods=[
-                "OpenTelemetry Agent",
-                "Cloud Monitoring sidecar"
-            ],
-            required_integrations=[
-                "Google Cloud Operations agent"
-            ],
-            setup_commands=[
-                "gcloud operations agent policies create --policy=otel-policy.yaml"
-            ]
-        )
-
-    def _aws_lambda_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """AWS Lambda prescription"""
-        return EventHandlingPrescription(
-            metrics_source="CloudWatch Metrics",
-            log_source="CloudWatch Logs",
-            trace_source="X-Ray",
-            alert_destination="CloudWatch Alarms → SNS → PagerDuty",
-            ingestion_methods=[
-                "CloudWatch Metrics automatic",
-                "CloudWatch Logs automatic",
-                "X-Ray tracing (enable in Lambda config)"
-            ],
-            required_integrations=[
-                "CloudWatch Logs Insights",
-                "X-Ray daemon"
-            ],
-            setup_commands=[
-                "aws lambda update-function-configuration --function-name <name> --tracing-config Mode=Active"
-            ]
-        )
-
-    def _cloud_run_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Google Cloud Run prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Cloud Monitoring",
-            log_source="Cloud Logging",
-            trace_source="Cloud Trace",
-            alert_destination="Cloud Alerting",
-            ingestion_methods=[
-                "Cloud Logging automatic",
-                "Cloud Monitoring with log-based metrics"
-            ],
-            required_integrations=[
-                "Cloud Operations (Stackdriver)"
-            ],
-            setup_commands=[
-                "gcloud run services update <service> --enable-execution-snapshot"  # For debugging
-            ]
-        )
-
-    def _cloud_functions_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Google Cloud Functions prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Cloud Monitoring",
-            log_source="Cloud Logging",
-            trace_source="Cloud Trace",
-            alert_destination="Cloud Alerting",
-            ingestion_methods=[
-                "Cloud Logging automatic",
-                "Cloud Monitoring metrics"
-            ],
-            required_integrations=[
-                "Cloud Functions logs automatically",
-                "Cloud Monitoring"
-            ],
-            setup_commands=[
-                "gcloud functions deploy <function> --trigger-http --runtime=python39"
-            ]
-        )
-
-    def _generic_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Generic prescription when platform unknown"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus (recommended)",
-            log_source="Loki (recommended)",
-            trace_source="Tempo (recommended)",
-            alert_destination="Alertmanager (recommended)",
-            ingestion_methods=[
-                "Application instrumented with /metrics endpoint",
-                "Structured logs to stdout",
-                "OpenTelemetry SDK for traces"
-            ],
-            required_integrations=[
-                "Requires manual setup"
-            ],
-            setup_commands=[
-                "Please specify hosting platform for detailed setup"
-            ]
-        )
-
-    # ========== European Cloud Provider Prescriptions ==========
-
-    def _scaleway_k8s_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Scaleway Kubernetes prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus (Scaleway Managed Prometheus)",
-            log_source="Loki or Scaleway Logs",
-            trace_source="Tempo or Grafana Cloud",
-            alert_destination="Alertmanager or Grafana OnCall",
-            ingestion_methods=[
-                "Prometheus scraping via ServiceMonitor",
-                "Fluent Bit for logs to Scaleway Object Storage",
-                "OpenTelemetry Collector for traces"
-            ],
-            required_integrations=[
-                "kube-state-metrics",
-                "cadvisor",
-                "Scaleway Container Registry metrics"
-            ],
-            setup_commands=[
-                "helm install kube-prometheus-stack prometheus-community/kube-prometheus-stack",
-                "kubectl apply -f https://raw.githubusercontent.com/scaleway/fluent-bit/master/compose/k8s/fluent-bit-daemonset.yaml"
-            ]
-        )
-
-    def _scaleway_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Scaleway VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki with Vector shipping",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter on all instances",
-                "Vector agent for log shipping",
-                "OpenTelemetry Collector"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "cadvisor",
-                "Vector"
-            ],
-            setup_commands=[
-                "scw instance attach <instance-id> --ip <load-balancer-ip>",
-                "curl -L https://github.com/prometheus/node_exporter/releases/download/v1.6.1/node_exporter-1.6.1.linux-amd64.tar.gz | tar xz"
-            ]
-        )
-
-    def _hetzner_k8s_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Hetzner Kubernetes prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "Prometheus via ServiceMonitor",
-                "Fluent Bit DaemonSet to Hetzner Storage Box",
-                "OpenTelemetry Collector"
-            ],
-            required_integrations=[
-                "kube-state-metrics",
-                "cadvisor",
-                "Hetzner Cloud Controller Manager metrics"
-            ],
-            setup_commands=[
-                "helm install kube-prometheus-stack prometheus-community/kube-prometheus-stack",
-                "hcloud volume create --size 10 --name loki-storage --automount"
-            ]
-        )
-
-    def _hetzner_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Hetzner VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter on all hcloud servers",
-                "Prometheus scraping hcloud metrics",
-                "Fluent Bit for logs"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "hcloud-exporter"
-            ],
-            setup_commands=[
-                "wget https://github.com/prometheus/node_exporter/releases/download/v1.6.1/node_exporter-1.6.1.linux-amd64.tar.gz",
-                "hcloud server attach-to-network <server-id> --network <metrics-network>"
-            ]
-        )
-
-    def _ovh_k8s_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """OVHcloud Kubernetes prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus (Managed Public Cloud)",
-            log_source="Loki or Graylog",
-            trace_source="Tempo or Jaeger",
-            alert_destination="Alertmanager or Grafana OnCall",
-            ingestion_methods=[
-                "Prometheus via ServiceMonitor",
-                "Fluent Bit for Logs to OVH Object Storage",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "kube-state-metrics",
-                "OVH Metrics"
-            ],
-            setup_commands=[
-                "kubectl apply -f https://raw.githubusercontent.com/ovh/manager/master/kube-prometheus/"
-            ]
-        )
-
-    def _ovh_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """OVHcloud VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki with OVH Logs integration",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter",
-                "OVH Logs API (vflow or syslog)",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "OVH Logs agent"
-            ],
-            setup_commands=[
-                "ovh vrack create --name observability",
-                "curl -L https://github.com/prometheus/node_exporter/releases/download/v1.6.1/node_exporter-1.6.1.linux-amd64.tar.gz | tar xz"
-            ]
-        )
-
-    def _exoscale_k8s_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Exoscale Kubernetes prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus",
-            log_source="Loki or Exoscale POL (Private Object Locker)",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "Prometheus scraping",
-                "Fluent Bit to Exoscale Object Storage",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "kube-state-metrics",
-                "Exoscale container registry metrics"
-            ],
-            setup_commands=[
-                "exo compute instance list",
-                "kubectl apply -f monitoring/"
-            ]
-        )
-
-    def _exoscale_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Exoscale VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter",
-                "Fluent Bit",
-                "OpenTelemetry Collector"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "Exoscale API metrics via exporter"
-            ],
-            setup_commands=[
-                "exo compute instance create --name <monitoring>"
-            ]
-        )
+    return {
+        catalog: tuple(tuple(share(option[name]) for name in field_names) for option in options)
+        for catalog, options in data.items()
+    }
 
-    def _ionos_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """IONOS VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter",
-                "Fluent Bit",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "IONOS API metrics"
-            ],
-            setup_commands=[
-                "ionosctl server create"
-            ]
-        )
 
-    def _gcore_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """G-Core Cloud VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter",
-                "Fluent Bit",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "G-Core CDN metrics"
-            ],
-            setup_commands=[
-                "gcore compute instance create"
-            ]
-        )
+def _read_catalog_cache(cache_path: Path, field_names: Tuple[str, ...]) -> Optional[Dict[str, Tuple[tuple, ...]]]:
+    """Cached rows if the pickle is this user's and matches the option fields, else None"""
+    try:
+        with open(cache_path, "rb") as f:
+            # The cache dir may be shared; only unpickle files we own and others can't modify
+            st = os.fstat(f.fileno())
+            if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+            payload = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        # Missing, truncated or written by a newer pickle protocol; rebuilt by the caller
+        return None
+    if not isinstance(payload, dict) or payload.get("fields") != field_names:
+        return None
+    rows = payload.get("catalog")
+    if not isinstance(rows, dict):
+        return None
+    for options in rows.values():
+        if not isinstance(options, tuple) or any(
+                not isinstance(option, tuple) or len(option) != len(field_names) for option in options):
+            return None
+    return rows
+
+
+def _write_catalog_cache(cache_path: Path, field_names: Tuple[str, ...],
+                         rows: Dict[str, Tuple[tuple, ...]]) -> None:
+    """Atomically write the pickled catalog; failures only mean parsing JSON next run"""
+    # tempfile pulls in shutil and random; only needed on a cache miss
+    import tempfile
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"fields": field_names, "catalog": rows}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
-    def _digitalocean_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """DigitalOcean VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter + DO exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter + do_exporter",
-                "Fluent Bit",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "DigitalOcean exporter (do_exporter)"
-            ],
-            setup_commands=[
-                "doctl compute droplet create",
-                "helm install kube-prometheus-stack prometheus-community/kube-prometheus-stack"
-            ]
-        )
 
-    def _vultr_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Vultr VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter + Vultr exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter + vultr_exporter",
-                "Fluent Bit",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "Vultr exporter"
-            ],
-            setup_commands=[
-                "vultr-server create",
-                "curl -sSL https://github.com/prometheus/node_exporter/releases/download/v1.6.1/node_exporter-1.6.1.linux-amd64.tar.gz | tar xz"
-            ]
-        )
+def _load_option_catalog(path: Path = _PROVIDERS_FILE) -> Dict[str, Tuple[EventHandlingOption, ...]]:
+    """Read the tiered-option catalog, from the pickle cache when it matches the JSON"""
+    raw = path.read_bytes()
+    field_names = tuple(f.name for f in fields(EventHandlingOption))
+    cache_path = _catalog_cache_path(raw, field_names)
+    rows = _read_catalog_cache(cache_path, field_names)
+    if rows is None:
+        rows = _parse_option_catalog(raw, field_names)
+        _write_catalog_cache(cache_path, field_names, rows)
+    return {
+        catalog: tuple(EventHandlingOption(*option) for option in options)
+        for catalog, options in rows.items()
+    }
 
-    def _linode_vm_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Linode/Akamai VM prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Prometheus node exporter + Linode exporter",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "node_exporter + linode_exporter",
-                "Fluent Bit",
-                "OpenTelemetry"
-            ],
-            required_integrations=[
-                "node_exporter",
-                "Linode exporter"
-            ],
-            setup_commands=[
-                "linode-cli linodes create",
-                "curl -sSL https://github.com/prometheus/node_exporter/releases/download/v1.6.1/node_exporter-1.6.1.linux-amd64.tar.gz | tar xz"
-            ]
-        )
 
-    # ========== PaaS Provider Prescriptions ==========
+class EventHandlingPrescriber:
+    """Prescribes event handling based on environment with price-quality tiers"""
 
-    def _heroku_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Heroku prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Heroku Labs Metrics",
-            log_source="Heroku Logplex ( drains to Loki)",
-            trace_source="Heroku Runtime (via OpenTelemetry)",
-            alert_destination="Heroku Alerts → PagerDuty/Slack",
-            ingestion_methods=[
-                "Heroku Labs metrics endpoint",
-                "Log drain to Loki HTTPS endpoint",
-                "OpenTelemetry SDK for APM"
-            ],
-            required_integrations=[
-                "Heroku Logplex drain",
-                "Heroku dyno metrics"
-            ],
-            setup_commands=[
-                "heroku addons:create heroku-redis -h <app>",
-                "heroku drains:add https://loki.example.com/loki/api/v1/push -h <app>"
-            ]
-        )
+    # Map (provider, platform) to its entry in data/providers.json
+    prescriptions = {
+        # Kubernetes prescriptions
+        (CloudProvider.UNKNOWN, ComputePlatform.KUBERNETES): "kubernetes",
+        (CloudProvider.AWS, ComputePlatform.KUBERNETES): "eks",
+        (CloudProvider.GCP, ComputePlatform.KUBERNETES): "gke",
+        (CloudProvider.AZURE, ComputePlatform.KUBERNETES_AKS): "aks",
+        (CloudProvider.SCALEWAY, ComputePlatform.KUBERNETES): "scaleway_k8s",
+        (CloudProvider.HETZNER, ComputePlatform.KUBERNETES): "hetzner_k8s",
+        (CloudProvider.OVHCLOUD, ComputePlatform.KUBERNETES): "ovh_k8s",
+        (CloudProvider.EXOSCALE, ComputePlatform.KUBERNETES): "exoscale_k8s",
+        (CloudProvider.DIGITAL_OCEAN, ComputePlatform.KUBERNETES): "digitalocean_k8s",
+
+        # Serverless prescriptions
+        (CloudProvider.AWS, ComputePlatform.SERVERLESS): "lambda",
+        (CloudProvider.AWS, ComputePlatform.SERVERLESS_LAMBDA): "lambda",
+        (CloudProvider.GCP, ComputePlatform.SERVERLESS): "cloud_run",
+        (CloudProvider.GCP, ComputePlatform.SERVERLESS_CLOUD_RUN): "cloud_run",
+
+        # PaaS prescriptions
+        (CloudProvider.HEROKU, ComputePlatform.PAAS_HEROKU): "heroku",
+        (CloudProvider.VERCEL, ComputePlatform.PAAS_VERCEL): "vercel",
+        (CloudProvider.NETLIFY, ComputePlatform.PAAS_NETLIFY): "netlify",
+        (CloudProvider.RAILWAY, ComputePlatform.PAAS_RAILWAY): "railway",
+        (CloudProvider.RENDER, ComputePlatform.PAAS_RENDER): "render",
+        (CloudProvider.FLY_IO, ComputePlatform.PAAS_FLY_IO): "fly_io",
+
+        # VM prescriptions (European clouds)
+        (CloudProvider.SCALEWAY, ComputePlatform.VM): "scaleway_vm",
+        (CloudProvider.HETZNER, ComputePlatform.VM): "hetzner_vm",
+        (CloudProvider.OVHCLOUD, ComputePlatform.VM): "ovh_vm",
+        (CloudProvider.EXOSCALE, ComputePlatform.VM): "exoscale_vm",
+        (CloudProvider.IONOS, ComputePlatform.VM): "ionos_vm",
+        (CloudProvider.DIGITAL_OCEAN, ComputePlatform.VM): "digitalocean_vm",
+        (CloudProvider.VULTR, ComputePlatform.VM): "vultr_vm",
+        (CloudProvider.LINODE, ComputePlatform.VM): "linode_vm",
 
-    def _vercel_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Vercel prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Vercel Analytics",
-            log_source="Vercel Logs ( drain to Loki)",
-            trace_source="Vercel APM or OpenTelemetry",
-            alert_destination="Vercel Notifications → PagerDuty",
-            ingestion_methods=[
-                "Vercel Analytics dashboard",
-                "Log drain to Loki",
-                "OpenTelemetry instrumentation"
-            ],
-            required_integrations=[
-                "Vercel Log Drain",
-                "Vercel Edge Network metrics"
-            ],
-            setup_commands=[
-                "vercel link integrate --project-id=<project>",
-                "Add log drain in Vercel dashboard"
-            ]
-        )
+        # Docker Compose
+        (CloudProvider.UNKNOWN, ComputePlatform.DOCKER_COMPOSE): "docker_compose",
+        (CloudProvider.SELF_HOSTED, ComputePlatform.DOCKER_COMPOSE): "docker_compose",
 
-    def _netlify_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Netlify prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Netlify Analytics",
-            log_source="Netlify Logs ( drain to Loki)",
-            trace_source="Edge Functions APM",
-            alert_destination="Netlify Notifications → Slack",
-            ingestion_methods=[
-                "Netlify Analytics",
-                "Functions log drains",
-                "OpenTelemetry for edge functions"
-            ],
-            required_integrations=[
-                "Netlify Functions logs",
-                "Edge Network metrics"
-            ],
-            setup_commands=[
-                "netlify addons:create analytics",
-                "Configure log drain in netlify.toml"
-            ]
-        )
+        # Default
+        (CloudProvider.UNKNOWN, ComputePlatform.UNKNOWN): "generic",
+    }
 
-    def _railway_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Railway prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Railway Metrics",
-            log_source="Railway Logs (structured JSON)",
-            trace_source="OpenTelemetry",
-            alert_destination="Railway Notifications → PagerDuty",
-            ingestion_methods=[
-                "Railway built-in metrics",
-                "Log forwarder to Loki",
-                "OpenTelemetry SDK"
-            ],
-            required_integrations=[
-                "Railway metrics endpoint",
-                "Log forwarding"
-            ],
-            setup_commands=[
-                "railway variables set METRICS_ENDPOINT=<prometheus>",
-                "railway domain"
-            ]
-        )
+    # (options, first option per tier) by catalog name, loaded on first use. Options
+    # are frozen, so every prescriber shares them
+    _OPTION_CATALOG: Optional[Dict[str, Tuple[Tuple[EventHandlingOption, ...], Dict[str, EventHandlingOption]]]] = None
+
+    def get_tiered_options(self, provider: CloudProvider,
+                           platform: ComputePlatform) -> Tuple[EventHandlingOption, ...]:
+        """Tiered options for a provider/platform pair (generic if unmapped); shared and read-only"""
+        return self._catalog_entry(provider, platform)[0]
+
+    def _catalog_entry(self, provider: CloudProvider, platform: ComputePlatform) -> tuple:
+        """(options, first option per tier) from the shared catalog, loaded on first use"""
+        catalog = EventHandlingPrescriber._OPTION_CATALOG
+        if catalog is None:
+            catalog = {}
+            for name, options in _load_option_catalog().items():
+                by_tier = {}
+                for option in options:
+                    by_tier.setdefault(option.tier, option)
+                catalog[name] = (options, by_tier)
+            EventHandlingPrescriber._OPTION_CATALOG = catalog
+        # Pairs without a catalog entry get the generic options
+        name = self.prescriptions.get((provider, platform), "generic")
+        return catalog.get(name) or catalog["generic"]
 
-    def _render_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Render prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Render Metrics",
-            log_source="Render Logs ( drain to Loki)",
-            trace_source="OpenTelemetry",
-            alert_destination="Render Alerts → PagerDuty",
-            ingestion_methods=[
-                "Render dashboard metrics",
-                "Log drain to Loki",
-                "OpenTelemetry SDK"
-            ],
-            required_integrations=[
-                "Render log drains",
-                "Render metrics API"
-            ],
-            setup_commands=[
-                "render env set METRICS_KEY=<key>",
-                "Add log drain in Render dashboard"
-            ]
-        )
+    def prescribe(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
+        """Generate tiered prescription based on analysis with opinionated recommendations"""
+        # Prescriptions reference the shared catalog tuple rather than copying it
+        options, by_tier = self._catalog_entry(analysis.cloud_provider, analysis.compute_platform)
 
-    def _fly_io_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Fly.io prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Fly.io Metrics + Prometheus",
-            log_source="Fly.io Logs ( drain to Loki)",
-            trace_source="Fly.io Tracing",
-            alert_destination="Alertmanager → PagerDuty",
-            ingestion_methods=[
-                "flyctl metrics",
-                "Log forwarding to Loki",
-                "OpenTelemetry tracing"
-            ],
-            required_integrations=[
-                "flyctl agent command for metrics",
-                "Log forwarding"
-            ],
-            setup_commands=[
-                "flyctl agent create --region <region>",
-                "fly volumes create loki-data --region <region>"
-            ]
+        # Use recommender to determine best tier
+        recommender = EventHandlingRecommender()
+        recommended_tier = recommender.recommend_tier(
+            analysis, analysis.cloud_provider, analysis.compute_platform
         )
 
-    # ========== Additional Prescriptions ==========
+        # Set primary to recommended tier
+        primary = by_tier.get(recommended_tier) or by_tier.get("balanced") or (options[0] if options else None)
 
-    def _aks_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Azure AKS prescription"""
-        return EventHandlingPrescription(
-            metrics_source="Azure Monitor Managed Prometheus",
-            log_source="Azure Monitor Logs / Container Insights",
-            trace_source="Azure Application Insights / Grafana Tempo",
-            alert_destination="Azure Monitor Alerts → Action Groups",
-            ingestion_methods=[
-                "Azure Monitor Metrics",
-                "Container Insights for logs",
-                "Azure Monitor Agent for traces"
-            ],
-            required_integrations=[
-                "Azure Monitor metrics addon",
-                "Container Insights"
-            ],
-            setup_commands=[
-                "az aks enable-addons -a monitoring -n <clusterName> -g <resourceGroup>",
-                "az aks update --resource-group <RG> --name <cluster> --enable-azure-monitor-metrics"
-            ]
+        # Store recommendation reasons for display
+        recommendation_reasons = recommender.recommendation_reasons[:]
+        observability_advice = recommender.get_observability_advice(
+            analysis, analysis.cloud_provider, analysis.compute_platform
         )
+        agent_focus = recommender.recommend_agent_focus(analysis)
 
-    def _docker_compose_prescription(self, analysis: RepositoryAnalysis) -> EventHandlingPrescription:
-        """Docker Compose prescription"""
         return EventHandlingPrescription(
-            metrics_source="Prometheus",
-            log_source="Loki",
-            trace_source="Tempo",
-            alert_destination="Alertmanager",
-            ingestion_methods=[
-                "Prometheus scraping container metrics",
-                "Fluent Bit container for log aggregation",
-                "OpenTelemetry Collector sidecar"
-            ],
-            required_integrations=[
-                "cAdvisor",
-                "node_exporter (on host)",
-                "Prometheus in docker-compose"
-            ],
-            setup_commands=[
-                "Add Prometheus, Grafana, Loki services to docker-compose.yml",
-                "docker-compose up -d monitoring-stack"
-            ]
+            primary=primary,
+            options=options,
+            selected_tier=recommended_tier,
+            # Recommendation metadata
+            recommendation_reasons=recommendation_reasons,
+            observability_advice=observability_advice,
+            agent_focus=agent_focus,
+            maturity_level=recommender.analyze_maturity(analysis)
         )
 
 
@@ -3443,13 +1865,13 @@ class AgentTeamPrescriber:
             optional.append("nodejs-memory-analyzer")
 
         return AgentTeamPrescription(
-            core_agents=self.CORE_AGENTS,
-            observer_agents=list(set(observers)),
-            monitor_agents=list(set(monitors)),
-            alerter_agents=list(set(alerters)),
-            controller_agents=list(set(controllers)),
-            responder_agents=list(set(responders)),
-            optional_agents=list(set(optional)),
+            core_agents=tuple(self.CORE_AGENTS),
+            observer_agents=tuple(set(observers)),
+            monitor_agents=tuple(set(monitors)),
+            alerter_agents=tuple(set(alerters)),
+            controller_agents=tuple(set(controllers)),
+            responder_agents=tuple(set(responders)),
+            optional_agents=tuple(set(optional)),
             custom_config={
                 "compute_platform": analysis.compute_platform.value,
                 "cloud_provider": analysis.cloud_provider.value,
@@ -3462,6 +1884,10 @@ class AgentTeamPrescriber:
 class SetupArtifactGenerator:
     """Generates setup artifacts for the specific environment"""
 
+    def __init__(self, json_output: bool = False):
+        # Write machine-consumed artifacts as JSON; rlc-config.yaml stays YAML for editing
+        self.json_output = json_output
+
     def generate(self, analysis: RepositoryAnalysis,
                  event_rx: EventHandlingPrescription,
                  team_rx: AgentTeamPrescription,
@@ -3476,17 +1902,29 @@ class SetupArtifactGenerator:
         # 1. Generate RLC configuration
         rlc_config = self._generate_rlc_config(analysis, team_rx)
         config_file = output_path / "rlc-config.yaml"
+        # Render to a string first so each file is a single write
         with open(config_file, "w") as f:
-            yaml.dump(rlc_config, f, default_flow_style=False)
+            f.write(_dump_yaml(rlc_config))
         artifacts["rlc_config"] = str(config_file)
 
         # 2. Generate event handling setup
         event_setup = self._generate_event_setup(analysis, event_rx)
         event_file = output_path / "event-handling-setup.yaml"
-        with open(event_file, "w") as f:
-            yaml.dump(event_setup, f, default_flow_style=False)
+        if self.json_output:
+            # JSON is valid YAML, so the construction agent loads either form
+            with open(event_file, "wb") as f:
+                f.write(_dump_json(event_setup))
+        else:
+            with open(event_file, "w") as f:
+                f.write(_dump_yaml(event_setup))
         artifacts["event_setup"] = str(event_file)
 
+        if self.json_output:
+            analysis_file = output_path / "repository-analysis.json"
+            with open(analysis_file, "wb") as f:
+                f.write(_dump_json(self._generate_analysis_summary(analysis)))
+            artifacts["analysis"] = str(analysis_file)
+
         # 3. Generate agent installation script
         install_script = self._generate_install_script(team_rx)
         script_file = output_path / "install-agents.sh"
@@ -3515,9 +1953,27 @@ class SetupArtifactGenerator:
 
         return artifacts
 
+    def _generate_analysis_summary(self, analysis: RepositoryAnalysis) -> Dict:
+        """Repository analysis without the full file list"""
+        return {
+            "path": analysis.path,
+            "languages": [l.value for l in analysis.languages],
+            "frameworks": list(analysis.frameworks),
+            "deployment_configs": list(analysis.deployment_configs),
+            "observability_tools": list(analysis.observability_tools),
+            "cloud_provider": analysis.cloud_provider.value,
+            "compute_platform": analysis.compute_platform.value,
+            "has_docker": analysis.has_docker,
+            "has_helm": analysis.has_helm,
+            "has_terraform": analysis.has_terraform,
+            "has_wasm": analysis.has_wasm,
+            "file_count": len(analysis.all_files)
+        }
+
     def _generate_rlc_config(self, analysis: RepositoryAnalysis,
                             team_rx: AgentTeamPrescription) -> Dict:
         """Generate RLC gates configuration"""
+        # Prescription fields are tuples, which the YAML safe dumper cannot represent
         return {
             "gates": {
                 "detection": {
@@ -3528,20 +1984,20 @@ class SetupArtifactGenerator:
                     "required_agents": ["incident-commander", "triage-analyst"]
                 },
                 "response": {
-                    "required_agents": team_rx.controller_agents + team_rx.responder_agents
+                    "required_agents": list(team_rx.controller_agents + team_rx.responder_agents)
                 },
                 "resolution": {
                     "required_agents": ["post-mortem-writer"]
                 }
             },
             "agent_team": {
-                "core": team_rx.core_agents,
-                "observers": team_rx.observer_agents,
-                "monitors": team_rx.monitor_agents,
-                "alerters": team_rx.alerter_agents,
-                "controllers": team_rx.controller_agents,
-                "responders": team_rx.responder_agents,
-                "optional": team_rx.optional_agents
+                "core": list(team_rx.core_agents),
+                "observers": list(team_rx.observer_agents),
+                "monitors": list(team_rx.monitor_agents),
+                "alerters": list(team_rx.alerter_agents),
+                "controllers": list(team_rx.controller_agents),
+                "responders": list(team_rx.responder_agents),
+                "optional": list(team_rx.optional_agents)
             },
             "environment": {
                 "compute_platform": analysis.compute_platform.value,
@@ -3555,6 +2011,7 @@ class SetupArtifactGenerator:
                              event_rx: EventHandlingPrescription) -> Dict:
         """Generate event handling setup with tiered options"""
         primary = event_rx.primary
+        # Prescription fields are tuples, which the YAML safe dumper cannot represent
         return {
             "selected_tier": event_rx.selected_tier,
             "primary_option": {
@@ -3576,12 +2033,12 @@ class SetupArtifactGenerator:
                 },
                 "alerts": {
                     "destination": primary.alert_destination,
-                    "integrations": primary.required_integrations
+                    "integrations": list(primary.required_integrations)
                 },
-                "setup_commands": primary.setup_commands,
-                "pros": primary.pros,
-                "cons": primary.cons,
-                "best_for": primary.best_for
+                "setup_commands": list(primary.setup_commands),
+                "pros": list(primary.pros),
+                "cons": list(primary.cons),
+                "best_for": list(primary.best_for)
             },
             "all_options": [
                 {
@@ -3805,6 +2262,8 @@ def main():
                        help="Skip interactive prompts, use generic recommendations")
     parser.add_argument("--explore", action="store_true",
                        help="Explore hosting options interactively without generating setup")
+    parser.add_argument("--json-output", action="store_true",
+                       help="Write machine-consumed artifacts as JSON (valid YAML)")
 
     args = parser.parse_args()
 
@@ -3938,7 +2397,7 @@ def main():
     team_rx = team_prescriber.prescribe(analysis)
 
     # Generate artifacts
-    generator = SetupArtifactGenerator()
+    generator = SetupArtifactGenerator(json_output=args.json_output)
     artifacts = generator.generate(analysis, event_rx, team_rx, args.output)
 
     # Display opinionated recommendations